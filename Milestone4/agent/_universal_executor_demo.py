@@ -0,0 +1,113 @@
+"""
+Manual demo for UniversalExecutor: runs a Google search end to end and prints
+the step results, screenshots and result summary.
+Run from Milestone4/: python -m agent._universal_executor_demo
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path so the demo also runs as a plain script
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agent.universal_executor import UniversalExecutor
+
+
+def main():
+    executor = UniversalExecutor()
+
+    print(f"\n{'='*60}")
+    print("Testing Universal Executor with Enhanced Screenshot Capture...")
+    print('='*60)
+
+    # Test case: Google search example (like "go to google search apples")
+    google_search_test = [
+        {
+            "action": "navigate", 
+            "url": "https://www.google.com",
+            "description": "Navigate to Google"
+        },
+        {
+            "action": "wait", 
+            "seconds": 2,
+            "description": "Wait for page to load"
+        },
+        {
+            "action": "type",
+            "selector": "textarea[name='q']",
+            "value": "apples nutrition facts",
+            "field_type": "search",
+            "description": "Search for apples nutrition"
+        },
+        {
+            "action": "click",
+            "selector": "input[value='Google Search']",
+            "text": "Google Search",
+            "description": "Click search button"
+        },
+        {
+            "action": "wait", 
+            "seconds": 3,
+            "description": "Wait for search results"
+        },
+        {
+            "action": "validate_page",
+            "type": "search",
+            "text": "results, showing, apples",
+            "min_indicators": 2,
+            "description": "Validate search results page"
+        }
+    ]
+
+    print("\nTest Case: Google search for 'apples nutrition facts'")
+    print("-" * 50)
+
+    # Generate a test report ID
+    test_report_id = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    results = executor.run(
+        parsed_actions=google_search_test, 
+        headless=False, 
+        report_id=test_report_id,
+        instruction="Go to google search apples nutrition facts"
+    )
+    executor.close()
+
+    # Print results
+    for r in results:
+        status_icon = "✅" if r['status'] == "Passed" else "❌" if r['status'] == "Failed" else "ℹ️"
+        step_num = r.get('step', '?')
+        action_desc = r.get('description', r['action'])
+        print(f"{status_icon} Step {step_num}: {action_desc}: {r['details']}")
+    
+        if r.get('screenshot'):
+            print(f"   📸 Screenshot: {r['screenshot']}")
+    
+        if r.get('result_content'):
+            print(f"   📋 Content: {r['result_content'][:100]}...")
+
+    # Get screenshot metadata
+    screenshots_metadata = executor.get_screenshots_metadata()
+    if screenshots_metadata.get('count', 0) > 0:
+        print(f"\n📸 Screenshots captured:")
+        print(f"   Total: {screenshots_metadata['count']}")
+    
+        if screenshots_metadata.get('result_page'):
+            print(f"   Result Page: {screenshots_metadata['result_page'].get('filename', 'captured')}")
+            print(f"   Result Summary: {screenshots_metadata['result_page'].get('result_summary', 'Available')}")
+    
+        if screenshots_metadata.get('last_failed'):
+            print(f"   Last Failed Step: Step {screenshots_metadata['last_failed'].get('step_number', '?')}")
+
+    result_summary = executor.get_result_summary()
+    if result_summary:
+        print(f"\n📋 Final Result Summary: {result_summary[:200]}...")
+
+    print(f"\n{'='*60}")
+    print("Executor ready for integration with reporting system")
+    print('='*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -179,9 +179,8 @@ class CodeGenerator:
                 if description:
                     lines.append(f"        # {description}")
                 lines.append("        time.sleep(2)")
-                lines.append("        page_content = page.content().lower()")
-                lines.append("        page_text = page.inner_text('body').lower()")
-                lines.append("        full_content = page_content + ' ' + page_text")
+                # Visible text plus URL, as the executor validates (no HTML serialization)
+                lines.append("        full_content = page.inner_text('body').lower() + ' ' + page.url.lower()")
                 lines.append("")
                 
                 if validation_type == "login":
@@ -389,7 +389,7 @@ class JSONReportGenerator:
         # Scan screenshots directory
         if os.path.exists(self.screenshots_dir):
             for filename in os.listdir(self.screenshots_dir):
-                if report_id in filename and filename.endswith('.png'):
+                if report_id in filename and filename.endswith(('.png', '.jpg')):
                     filepath = os.path.join(self.screenshots_dir, filename)
                     
                     # Skip thumbnails
@@ -208,7 +208,7 @@ class ReportGenerator:
         # Also scan the screenshots directory
         if os.path.exists(self.screenshots_dir):
             for filename in os.listdir(self.screenshots_dir):
-                if report_id in filename and filename.endswith('.png'):
+                if report_id in filename and filename.endswith(('.png', '.jpg')):
                     # Skip thumbnails
                     if not filename.startswith('thumb_'):
                         filepath = os.path.join(self.screenshots_dir, filename)
@@ -1190,16 +1190,17 @@ class ReportGenerator:
                         try:
                             with open(screenshot["path"], "rb") as f:
                                 img_data = base64.b64encode(f.read()).decode()
+                            img_mime = "image/jpeg" if screenshot["path"].endswith(".jpg") else "image/png"
                             
                             screenshot_type = screenshot.get("type", "step")
                             description = screenshot.get("description", "Screenshot")
                             
                             html_content += f"""
                     <div class="screenshot-card">
-                        <img src="data:image/png;base64,{img_data}" 
+                        <img src="data:{img_mime};base64,{img_data}" 
                              class="screenshot-img" 
                              alt="{description}"
-                             onclick="window.open('data:image/png;base64,{img_data}')">
+                             onclick="window.open('data:{img_mime};base64,{img_data}')">
                         <div class="screenshot-info">
                             <div class="screenshot-label">
                                 {'🎯 Result Page' if screenshot_type == 'result_page' else '❌ Failed Step' if screenshot_type == 'failed_step' else '📸 Step Screenshot'}
@@ -1295,11 +1296,12 @@ class ReportGenerator:
                     try:
                         with open(screenshot_path, "rb") as img_file:
                             img_data = base64.b64encode(img_file.read()).decode()
+                        img_mime = "image/jpeg" if screenshot_path.endswith(".jpg") else "image/png"
                         html_content += f"""
                         <div style="margin-top: 10px;">
-                            <img src="data:image/png;base64,{img_data}" 
+                            <img src="data:{img_mime};base64,{img_data}" 
                                  style="max-width: 200px; border-radius: 4px; border: 1px solid #ddd; cursor: pointer;"
-                                 onclick="window.open('data:image/png;base64,{img_data}')"
+                                 onclick="window.open('data:{img_mime};base64,{img_data}')"
                                  alt="Step Screenshot">
                         </div>
 """
@@ -1674,16 +1676,17 @@ class ReportGenerator:
                         try:
                             with open(screenshot["path"], "rb") as f:
                                 img_data = base64.b64encode(f.read()).decode()
+                            img_mime = "image/jpeg" if screenshot["path"].endswith(".jpg") else "image/png"
                             
                             screenshot_type = screenshot.get("type", "step")
                             description = screenshot.get("description", "Screenshot")
                             
                             html_content += f'''
                 <div class="screenshot-item">
-                    <img src="data:image/png;base64,{img_data}" 
+                    <img src="data:{img_mime};base64,{img_data}" 
                          class="screenshot-img" 
                          alt="{description}"
-                         onclick="window.open('data:image/png;base64,{img_data}')">
+                         onclick="window.open('data:{img_mime};base64,{img_data}')">
                     <div style="margin-top: 5px; font-size: 12px;">
                         {description}
                     </div>
@@ -199,7 +199,7 @@ class ResultSummarizer:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = ' '.join(text.split())
         
         # Remove common noise
         noise_patterns = [
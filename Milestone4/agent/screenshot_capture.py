@@ -6,13 +6,34 @@ Uses Gemini AI for intelligent content summarization
 
 import os
 import time
+import hashlib
+import threading
+import itertools
+from collections import OrderedDict
 from datetime import datetime
+from urllib.parse import urlparse
 import re
 from PIL import Image
 import io
 import base64
 import traceback
 import json
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# Try to import OpenCV for faster thumbnail generation
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Try to import selectolax for parsing page HTML outside the browser
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 # Try to import Gemini
 try:
@@ -22,6 +43,60 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("[ScreenshotCapture] Gemini not available, using basic extraction")
 
+# Sentence boundaries for the basic (non-Gemini) summary
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Screenshot file types written by this module (thumbnails excluded by prefix)
+SCREENSHOT_EXTENSIONS = ('.png', '.jpg')
+
+# Known sites, matched against the URL's host: the domain itself or any subdomain
+# of it, so x.com never matches netflix.com. Alternatives are in the order the
+# sites are checked; with the match anchored to the end of the host at most one
+# of them can apply.
+_SITE_RE = re.compile(r'(?:.+\.)?(wikipedia\.org|google\.com|amazon\.(?:com|in)|youtube\.com|linkedin\.com|twitter\.com|x\.com)')
+_SITE_KEYS = {
+    "wikipedia.org": "wikipedia",
+    "google.com": "google",
+    "amazon.com": "amazon",
+    "amazon.in": "amazon",
+    "youtube.com": "youtube",
+    "linkedin.com": "linkedin",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+}
+_SITE_SUMMARY_LABELS = {
+    "wikipedia": "Wikipedia article",
+    "google": "Google page",
+    "amazon": "Amazon page",
+    "youtube": "YouTube",
+    "linkedin": "LinkedIn",
+    "twitter": "Twitter/X",
+    "generic": "Page",
+}
+
+
+def _detect_site(url):
+    """Return the site key for a URL, or "generic" for unknown sites"""
+    match = _SITE_RE.fullmatch(urlparse(url).hostname or "")
+    return _SITE_KEYS[match.group(1)] if match else "generic"
+
+
+def _truncate(text, limit):
+    """Cut text to limit characters, marking the cut with '...' (short text is returned as is)"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+# innerText of the first n matches of a selector that are visible, in one round-trip
+_VISIBLE_TEXTS_JS = """([selector, limit]) => [...document.querySelectorAll(selector)]
+    .slice(0, limit)
+    .filter(e => e.offsetParent !== null)
+    .map(e => e.innerText)"""
+
+# Title and body text preview in a single browser round-trip
+_PAGE_BASICS_JS = """() => ({
+    title: document.title,
+    text: document.body ? document.body.innerText.slice(0, 1000) : ""
+})"""
+
 
 class ScreenshotCapture:
     """
@@ -29,11 +104,61 @@ class ScreenshotCapture:
     Uses Gemini AI for intelligent summarization when available
     """
     
-    def __init__(self, reports_dir="reports", api_key=None):
+    # Seconds a page's extracted content stays valid while the URL/title are unchanged
+    CONTENT_CACHE_TTL = 30
+    
+    # Entries kept in the extracted-content and Gemini summary caches, most
+    # recently used last; each extracted entry holds a full page text
+    CONTENT_CACHE_SIZE = 16
+    SUMMARY_CACHE_SIZE = 64
+    
+    # Below this many characters a Gemini summary adds nothing over the basic one
+    MIN_GEMINI_CONTENT = 200
+    
+    # Per-step screenshots are transient debugging aids, so they are saved as JPEG;
+    # only the final result page keeps a lossless PNG
+    STEP_JPEG_QUALITY = 60
+    
+    # Playwright timeout (ms) for the final result page and for the viewport-only
+    # retry of a step screenshot that overran its budget; long pages need it
+    SCREENSHOT_TIMEOUT_MS = 20000
+    # Seconds to wait for a thumbnail before listing the screenshot without one
+    THUMBNAIL_WAIT = 10
+    
+    def __init__(self, reports_dir="reports", api_key=None, screenshot_budget_ms=3000):
         self.reports_dir = reports_dir
+        # Soft target for a step's full-page screenshot; past it the step falls
+        # back to a viewport-only capture (see _step_screenshot)
+        self.screenshot_budget_ms = screenshot_budget_ms
         self.screenshots_dir = os.path.join(reports_dir, "screenshots")
         os.makedirs(self.screenshots_dir, exist_ok=True)
         
+        # Cached screenshot listings per report ID, kept in sync by capture/delete
+        self._index = {}
+        # report ID -> (timestamp formatted once, capture counter) for filenames
+        self._capture_seq = {}
+        
+        # Extracted content ((time, content)) and Gemini summaries ((content
+        # digest, summary)) keyed by (url, title), bounded LRUs
+        self._page_content_cache = OrderedDict()
+        self._summary_cache = OrderedDict()
+        # (content digest, summary) of the latest Gemini summary, one tuple so
+        # summary pool threads never pair one page's digest with another's summary
+        self._last_summary = (None, None)
+        self._summary_lock = threading.Lock()
+        
+        # Background pool so Gemini summaries don't block the test run
+        self._summary_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="summary")
+        # Site-specific content extractors, see _detect_site
+        self._site_extractors = {
+            "wikipedia": self._extract_wikipedia_sections,
+            "google": self._extract_google_sections,
+            "amazon": self._extract_amazon_sections,
+        }
+        
+        # Thumbnails are CPU-bound and independent of the page, so they overlap with extraction
+        self._thumb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumb")
+        
         # Initialize Gemini if available
         self.gemini_client = None
         self.gemini_available = False
@@ -41,15 +166,10 @@ class ScreenshotCapture:
         
         if self.api_key and GEMINI_AVAILABLE:
             try:
+                # No test request here - connection problems surface on first summary
                 self.gemini_client = genai.Client(api_key=self.api_key)
-                # Test connection
-                response = self.gemini_client.models.generate_content(
-                    model="gemini-1.5-flash",
-                    contents="Say OK"
-                )
-                if response.text and "OK" in response.text.upper():
-                    self.gemini_available = True
-                    print("[ScreenshotCapture] ✅ Gemini AI initialized for intelligent summarization")
+                self.gemini_available = True
+                print("[ScreenshotCapture] ✅ Gemini AI initialized for intelligent summarization")
             except Exception as e:
                 print(f"[ScreenshotCapture] ⚠️ Gemini init failed: {e}")
                 self.gemini_available = False
@@ -63,10 +183,25 @@ class ScreenshotCapture:
         if not self.gemini_available or not content:
             return None
         
+        # Tiny pages aren't worth a billable request
+        if len(content) < self.MIN_GEMINI_CONTENT:
+            return self._create_basic_summary(content)
+        
+        cache_key = (url, title)
+        content_digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        with self._summary_lock:
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                self._summary_cache.move_to_end(cache_key)
+            last_digest, last_summary = self._last_summary
+        if cached and cached[0] == content_digest:
+            return cached[1]
+        if content_digest == last_digest and last_summary:
+            return last_summary
+        
         try:
             # Truncate content if too long (Gemini has limits)
-            if len(content) > 5000:
-                content = content[:5000] + "..."
+            content = _truncate(content, 5000)
             
             prompt = f"""You are a content summarizer for a test automation report. 
             
@@ -90,27 +225,35 @@ Summary:"""
             
             if response and response.text:
                 summary = response.text.strip()
-                print(f"[ScreenshotCapture] ✨ Gemini generated summary: {summary[:100]}...")
+                print(f"[ScreenshotCapture] ✨ Gemini generated summary: {_truncate(summary, 100)}")
+                with self._summary_lock:
+                    self._lru_put(self._summary_cache, cache_key, (content_digest, summary), self.SUMMARY_CACHE_SIZE)
+                    self._last_summary = (content_digest, summary)
                 return summary
             else:
                 return None
                 
         except Exception as e:
             print(f"[ScreenshotCapture] ⚠️ Gemini summarization failed: {e}")
+            # Bad or unauthorized API key won't fix itself - stop calling Gemini
+            if getattr(e, "code", None) in (400, 401, 403) and "key" in str(e).lower():
+                self.gemini_available = False
+                print("[ScreenshotCapture] Gemini disabled, using basic summaries")
             return None
     
     def capture(self, page, filename_prefix="screenshot"):
         """Capture a screenshot and return the filepath"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             filename = f"{filename_prefix}_{timestamp}.png"
             filepath = os.path.join(self.screenshots_dir, filename)
             
             # Take screenshot
-            page.screenshot(path=filepath, full_page=True)
+            image_bytes = self._step_screenshot(page, filepath)
             
             # Create thumbnail
-            self._create_thumbnail(filepath)
+            thumb_path = self._create_thumbnail(filepath, image_bytes=image_bytes)
+            self._index_add(filename, os.path.basename(thumb_path) if thumb_path else None)
             
             print(f"[ScreenshotCapture] Captured: {filename}")
             return filepath
@@ -119,7 +262,7 @@ Summary:"""
             print(f"[ScreenshotCapture] Failed to capture: {e}")
             return None
     
-    def capture_with_analysis(self, page, report_id, description="", is_final_result=False):
+    def capture_with_analysis(self, page, report_id, description="", is_final_result=False, page_text=None):
         """
         Capture screenshot with page analysis and content extraction
         
@@ -128,54 +271,52 @@ Summary:"""
             report_id: Report ID for naming
             description: Description of the screenshot
             is_final_result: Whether this is the final result page
+            page_text: Content the caller already extracted; skips the extraction here
             
         Returns:
             Dictionary with screenshot info and analysis
         """
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            if is_final_result:
-                screenshot_type = "result_page"
-            else:
-                screenshot_type = "screenshot"
-            
-            # Clean description for filename
-            clean_desc = re.sub(r'[^\w\s-]', '', description)
-            clean_desc = clean_desc.replace(' ', '_')[:30]
-            
-            filename = f"{screenshot_type}_{report_id}_{clean_desc}_{timestamp}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            
-            # Take screenshot
-            page.screenshot(path=filepath, full_page=True)
+            captured_at = datetime.now()
+            filename, filepath, image_bytes, timestamp = self._take_screenshot(
+                page, report_id, description, is_final_result
+            )
             
-            # Create thumbnail
-            thumb_filename = f"thumb_{filename}"
+            # Create thumbnail on a worker while the page is being analyzed
+            thumb_filename = self._thumb_name(filename)
             thumb_path = os.path.join(self.screenshots_dir, thumb_filename)
-            self._create_thumbnail(filepath, thumb_path)
+            thumb_future = self._thumb_pool.submit(
+                self._create_thumbnail, filepath, thumb_path, image_bytes=image_bytes
+            )
             
             # Get page analysis with content extraction
-            analysis = self._analyze_page(page, description, is_final_result)
+            basics = self._read_page_basics(page)
+            analysis = self._analyze_page(page, description, is_final_result, basics=basics, captured_at=captured_at)
             
-            # Extract detailed content
-            page_content = self._extract_detailed_content(page)
+            # Extract detailed content unless the caller already has it
+            if page_text:
+                page_content = page_text
+            else:
+                page_content = self._extract_detailed_content(page, title=basics["title"])
+            
+            try:
+                thumb_created = thumb_future.result(timeout=self.THUMBNAIL_WAIT)
+            except FutureTimeoutError:
+                # Listed without a thumbnail; the worker still finishes writing it
+                thumb_created = None
+            self._index_add(filename, thumb_filename if thumb_created else None)
             
             # Generate intelligent summary using Gemini for final result
             result_summary = None
+            summary_future = None
             if is_final_result and page_content:
-                # Try Gemini first
+                # Basic summary is available immediately; Gemini refines it in the background
+                result_summary = self._create_basic_summary(page_content)
                 if self.gemini_available:
-                    title = page.title() if page.title() else "Result page"
-                    gemini_summary = self._summarize_with_gemini(page_content, title, page.url)
-                    if gemini_summary:
-                        result_summary = gemini_summary
-                    else:
-                        # Fallback to basic summary
-                        result_summary = self._create_basic_summary(page_content)
-                else:
-                    # Use basic summary
-                    result_summary = self._create_basic_summary(page_content)
+                    title = basics["title"] or "Result page"
+                    summary_future = self._summary_pool.submit(
+                        self._summarize_with_gemini, page_content, title, basics["url"]
+                    )
                 
                 # Store full content separately
                 analysis["full_content"] = page_content
@@ -194,10 +335,12 @@ Summary:"""
                 "full_content": page_content if is_final_result else None,
                 "is_final_result": is_final_result
             }
+            if summary_future is not None:
+                screenshot_info["result_summary_future"] = summary_future
             
             print(f"📸 Screenshot captured: {filename}")
             if is_final_result and result_summary:
-                print(f"📋 Result Summary: {result_summary[:150]}...")
+                print(f"📋 Result Summary: {_truncate(result_summary, 150)}")
             
             return screenshot_info
             
@@ -206,19 +349,134 @@ Summary:"""
             traceback.print_exc()
             return None
     
+    def capture_only(self, page, report_id, description=""):
+        """
+        Capture a step screenshot without page analysis or content extraction
+        
+        Used for steps that passed; failed steps and the final result page
+        still go through capture_with_analysis.
+        
+        Returns:
+            Dictionary with screenshot info (no analysis)
+        """
+        try:
+            filename, filepath, image_bytes, timestamp = self._take_screenshot(
+                page, report_id, description, False
+            )
+            
+            thumb_filename = self._thumb_name(filename)
+            thumb_path = os.path.join(self.screenshots_dir, thumb_filename)
+            thumb_created = self._create_thumbnail(filepath, thumb_path, image_bytes=image_bytes)
+            self._index_add(filename, thumb_filename if thumb_created else None)
+            
+            print(f"📸 Screenshot captured: {filename}")
+            
+            return {
+                "filename": filename,
+                "thumb_filename": thumb_filename,
+                "screenshot_path": filepath,
+                "thumb_path": thumb_path,
+                "timestamp": timestamp,
+                "description": description,
+                "analysis": None,
+                "result_summary": "Step captured",
+                "full_content": None,
+                "is_final_result": False
+            }
+            
+        except Exception as e:
+            print(f"❌ Screenshot capture failed: {e}")
+            traceback.print_exc()
+            return None
+    
+    def _capture_stamp(self, report_id):
+        """Report timestamp (formatted once per report) plus this capture's sequence number"""
+        entry = self._capture_seq.get(report_id)
+        if entry is None:
+            entry = self._capture_seq[report_id] = (datetime.now().strftime('%Y%m%d_%H%M%S'), itertools.count(1))
+        base, counter = entry
+        return f"{base}_{next(counter):03d}"
+    
+    def _take_screenshot(self, page, report_id, description, is_final_result):
+        """Save a full-page screenshot and return (filename, filepath, image bytes, stamp)"""
+        timestamp = self._capture_stamp(report_id)
+        if is_final_result:
+            screenshot_type = "result_page"
+        else:
+            screenshot_type = "screenshot"
+        
+        # Clean description for filename
+        clean_desc = re.sub(r'[^\w\s-]', '', description)
+        clean_desc = clean_desc.replace(' ', '_')[:30]
+        
+        extension = "png" if is_final_result else "jpg"
+        filename = f"{screenshot_type}_{report_id}_{clean_desc}_{timestamp}.{extension}"
+        filepath = os.path.join(self.screenshots_dir, filename)
+        
+        if is_final_result:
+            image_bytes = page.screenshot(path=filepath, full_page=True,
+                                          timeout=self.SCREENSHOT_TIMEOUT_MS)
+        else:
+            image_bytes = self._step_screenshot(page, filepath, type="jpeg",
+                                                quality=self.STEP_JPEG_QUALITY)
+        return filename, filepath, image_bytes, timestamp
+    
+    def _step_screenshot(self, page, filepath, **options):
+        """Full-page screenshot within the budget; a page too long for that is
+        captured viewport-only instead, so the step keeps a screenshot"""
+        try:
+            return page.screenshot(path=filepath, full_page=True,
+                                   timeout=self.screenshot_budget_ms, **options)
+        except Exception as e:
+            if "Timeout" not in type(e).__name__:
+                raise
+            print(f"[ScreenshotCapture] Full-page screenshot over {self.screenshot_budget_ms}ms, capturing the viewport")
+            return page.screenshot(path=filepath, full_page=False,
+                                   timeout=self.SCREENSHOT_TIMEOUT_MS, **options)
+    
+    def resolve_summary(self, screenshot_info, timeout=None):
+        """
+        Wait for a pending Gemini summary and store it in screenshot_info
+        
+        Keeps the basic summary if Gemini fails or does not finish within timeout.
+        """
+        if not screenshot_info:
+            return None
+        
+        future = screenshot_info.pop("result_summary_future", None)
+        if future is not None:
+            try:
+                gemini_summary = future.result(timeout=timeout)
+                if gemini_summary:
+                    screenshot_info["result_summary"] = gemini_summary
+            except Exception as e:
+                print(f"[ScreenshotCapture] ⚠️ Gemini summary not available: {e}")
+        
+        return screenshot_info.get("result_summary")
+    
+    def close(self):
+        """Shut down the worker pools: pending thumbnails are finished, queued summaries dropped"""
+        self._summary_pool.shutdown(wait=False, cancel_futures=True)
+        self._thumb_pool.shutdown(wait=True)
+    
     def _create_basic_summary(self, content):
         """Create a basic summary when Gemini is not available"""
         if not content:
             return "Page loaded successfully"
         
-        # Take first 2-3 sentences
-        sentences = re.split(r'[.!?]+', content)
+        # Take first 2-3 sentences, stopping the scan as soon as we have enough
         summary_sentences = []
         char_count = 0
+        start = 0
+        boundaries = _SENT_RE.finditer(content)
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(sentence) > 20:
+        while start is not None:
+            match = next(boundaries, None)
+            end = match.start() if match else len(content)
+            sentence = content[start:end].strip()
+            start = match.end() if match else None
+            
+            if len(sentence) > 20:
                 summary_sentences.append(sentence)
                 char_count += len(sentence)
                 if char_count > 300 or len(summary_sentences) >= 3:
@@ -227,16 +485,51 @@ Summary:"""
         if summary_sentences:
             return '. '.join(summary_sentences) + '.'
         else:
-            return content[:300] + "..." if len(content) > 300 else content
+            return _truncate(content, 300)
     
-    def _extract_detailed_content(self, page):
+    @staticmethod
+    def _lru_put(cache, key, value, size):
+        """Store value as the most recent entry of an OrderedDict, evicting the oldest past size"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+    
+    def _read_page_basics(self, page):
+        """Read URL, title and body text preview (first 1000 chars) in one round-trip"""
+        try:
+            basics = page.evaluate(_PAGE_BASICS_JS)
+        except Exception:
+            basics = {"title": "", "text": ""}
+        basics["url"] = page.url
+        return basics
+    
+    def _extract_detailed_content(self, page, title=None):
         """
         Extract detailed content from page for result summary
         Enhanced version with better content extraction for various sites
+        Reuses the previous extraction while the page URL and title are unchanged
         """
+        try:
+            cache_key = (page.url, page.title() if title is None else title)
+            cached = self._page_content_cache.get(cache_key)
+            if cached is not None and time.time() - cached[0] < self.CONTENT_CACHE_TTL:
+                self._page_content_cache.move_to_end(cache_key)
+                return cached[1]
+            
+            content = self._extract_page_sections(page)
+            self._lru_put(self._page_content_cache, cache_key, (time.time(), content), self.CONTENT_CACHE_SIZE)
+            return content
+        except Exception as e:
+            print(f"Error in _extract_detailed_content: {e}")
+            traceback.print_exc()
+            return "Could not extract page content"
+    
+    def _extract_page_sections(self, page):
+        """Walk the page and collect title, description and site-specific content"""
         try:
             content_parts = []
-            current_url = page.url.lower()
+            current_url = page.url
             
             # Get page title
             try:
@@ -252,131 +545,14 @@ Summary:"""
                 if meta_desc:
                     content = meta_desc.get_attribute("content")
                     if content:
-                        content_parts.append(f"Description: {content[:200]}...")
+                        content_parts.append(f"Description: {_truncate(content, 200)}")
             except:
                 pass
             
             # Site-specific content extraction
-            if "wikipedia.org" in current_url:
-                # Wikipedia article - extract full article content
-                try:
-                    # Get article title
-                    title_elem = page.locator("#firstHeading").first
-                    if title_elem.is_visible():
-                        title = title_elem.inner_text()
-                        if title:
-                            content_parts.append(f"Wikipedia Article: {title}")
-                    
-                    # Get article content paragraphs - get more paragraphs for better summary
-                    paragraphs = page.locator(".mw-parser-output p").all()
-                    article_paragraphs = []
-                    for p in paragraphs[:10]:  # Get first 10 paragraphs
-                        if p.is_visible():
-                            text = p.inner_text()
-                            if text and len(text.strip()) > 30 and not text.startswith("Jump to navigation"):
-                                # Clean text
-                                text = re.sub(r'\s+', ' ', text)
-                                article_paragraphs.append(text.strip())
-                    
-                    if article_paragraphs:
-                        content_parts.extend(article_paragraphs[:5])  # Add first 5 paragraphs
-                    
-                    # Get section headings for context
-                    headings = page.locator(".mw-parser-output h2, .mw-parser-output h3").all()
-                    section_names = []
-                    for h in headings[:5]:
-                        if h.is_visible():
-                            text = h.inner_text()
-                            if text and "See also" not in text and "References" not in text:
-                                section_names.append(text.strip())
-                    
-                    if section_names:
-                        content_parts.append(f"Sections include: {', '.join(section_names[:5])}")
-                        
-                except Exception as e:
-                    print(f"Error extracting Wikipedia content: {e}")
-            
-            elif "google.com" in current_url:
-                # Google search results
-                try:
-                    # Get search query
-                    search_box = page.locator("textarea[name='q'], input[name='q']").first
-                    if search_box:
-                        query = search_box.get_attribute("value")
-                        if query:
-                            content_parts.append(f"Search Query: {query}")
-                    
-                    # Get result stats
-                    stats = page.locator("#result-stats").first
-                    if stats:
-                        stats_text = stats.inner_text()
-                        if stats_text:
-                            content_parts.append(f"Search Statistics: {stats_text}")
-                    
-                    # Get search result snippets
-                    snippets = page.locator(".VwiC3b, .MUxGbd, .lyLwlc, .g .VwiC3b").all()
-                    for i, snippet in enumerate(snippets[:5]):
-                        if snippet.is_visible():
-                            text = snippet.inner_text()
-                            if text and len(text.strip()) > 20:
-                                content_parts.append(f"Result {i+1}: {text[:200]}...")
-                except Exception as e:
-                    print(f"Error extracting Google content: {e}")
-            
-            elif "amazon.com" in current_url or "amazon.in" in current_url:
-                # Amazon product or search page
-                try:
-                    # Check if it's a product page
-                    product_title = page.locator("#productTitle, .a-size-large").first
-                    if product_title.is_visible():
-                        title = product_title.inner_text()
-                        if title:
-                            content_parts.append(f"Product: {title[:200]}...")
-                        
-                        # Get price
-                        price = page.locator(".a-price-whole, .a-price .a-offscreen").first
-                        if price.is_visible():
-                            price_text = price.inner_text()
-                            if price_text:
-                                content_parts.append(f"Price: {price_text}")
-                        
-                        # Get rating
-                        rating = page.locator(".a-icon-alt, #acrPopover .a-size-base").first
-                        if rating.is_visible():
-                            rating_text = rating.inner_text()
-                            if rating_text:
-                                content_parts.append(f"Rating: {rating_text}")
-                        
-                        # Get product description
-                        desc = page.locator("#productDescription, #feature-bullets").first
-                        if desc.is_visible():
-                            desc_text = desc.inner_text()
-                            if desc_text:
-                                content_parts.append(f"Description: {desc_text[:200]}...")
-                    else:
-                        # Search results page
-                        search_box = page.locator("#twotabsearchtextbox").first
-                        if search_box:
-                            query = search_box.get_attribute("value")
-                            if query:
-                                content_parts.append(f"Search: {query}")
-                        
-                        # Get result count
-                        result_count = page.locator(".a-section.a-spacing-small.a-spacing-top-small span").first
-                        if result_count.is_visible():
-                            count_text = result_count.inner_text()
-                            if count_text:
-                                content_parts.append(f"Results: {count_text}")
-                        
-                        # Get first few product titles
-                        products = page.locator(".s-result-item h2 a span, .a-size-medium.a-color-base.a-text-normal").all()
-                        for i, product in enumerate(products[:5]):
-                            if product.is_visible():
-                                text = product.inner_text()
-                                if text:
-                                    content_parts.append(f"Product {i+1}: {text[:150]}...")
-                except Exception as e:
-                    print(f"Error extracting Amazon content: {e}")
+            extractor = self._site_extractors.get(_detect_site(current_url))
+            if extractor:
+                extractor(page, content_parts)
             
             # Generic content extraction for any site
             if len(content_parts) < 3:  # If we don't have enough content
@@ -388,22 +564,18 @@ Summary:"""
                         if elem.is_visible():
                             text = elem.inner_text()
                             if text and len(text.strip()) > 50:
-                                text = re.sub(r'\s+', ' ', text)
-                                if len(text) > 500:
-                                    text = text[:500] + "..."
+                                text = ' '.join(text.split())
+                                text = _truncate(text, 500)
                                 content_parts.append(text)
                                 break
                     
                     # Get paragraphs if still no content
                     if len(content_parts) < 2:
-                        paragraphs = page.locator("p").all()
                         para_texts = []
-                        for p in paragraphs[:8]:
-                            if p.is_visible():
-                                text = p.inner_text()
-                                if text and len(text.strip()) > 20:
-                                    text = re.sub(r'\s+', ' ', text)
-                                    para_texts.append(text)
+                        for text in self._visible_texts(page, "p", 8):
+                            if text and len(text.strip()) > 20:
+                                text = ' '.join(text.split())
+                                para_texts.append(text)
                         
                         if para_texts:
                             content_parts.append(" ".join(para_texts[:5]))
@@ -417,77 +589,266 @@ Summary:"""
                 # Last resort: get body text
                 try:
                     body_text = page.inner_text("body")
-                    body_text = re.sub(r'\s+', ' ', body_text)
-                    if len(body_text) > 1000:
-                        body_text = body_text[:1000] + "..."
+                    body_text = ' '.join(body_text.split())
+                    body_text = _truncate(body_text, 1000)
                     return body_text
                 except:
                     return "Page loaded successfully"
                     
         except Exception as e:
-            print(f"Error in _extract_detailed_content: {e}")
+            print(f"Error in _extract_page_sections: {e}")
             traceback.print_exc()
             return "Could not extract page content"
     
-    def _create_thumbnail(self, image_path, thumb_path=None, size=(320, 240)):
+    def _extract_wikipedia_sections(self, page, content_parts):
+        """Wikipedia article - extract full article content"""
+        try:
+            if SELECTOLAX_AVAILABLE:
+                self._extract_wikipedia_from_html(HTMLParser(page.content()), content_parts)
+                return
+            
+            # Get article title
+            title_elem = page.locator("#firstHeading").first
+            if title_elem.is_visible():
+                title = title_elem.inner_text()
+                if title:
+                    content_parts.append(f"Wikipedia Article: {title}")
+            
+            # Get article content paragraphs - get more paragraphs for better summary
+            article_paragraphs = []
+            for text in self._visible_texts(page, ".mw-parser-output p", 10):  # First 10 paragraphs
+                if text and len(text.strip()) > 30 and not text.startswith("Jump to navigation"):
+                    # Clean text
+                    text = ' '.join(text.split())
+                    article_paragraphs.append(text.strip())
+            
+            if article_paragraphs:
+                content_parts.extend(article_paragraphs[:5])  # Add first 5 paragraphs
+            
+            # Get section headings for context
+            section_names = []
+            for text in self._visible_texts(page, ".mw-parser-output h2, .mw-parser-output h3", 5):
+                if text and "See also" not in text and "References" not in text:
+                    section_names.append(text.strip())
+            
+            if section_names:
+                content_parts.append(f"Sections include: {', '.join(section_names[:5])}")
+                
+        except Exception as e:
+            print(f"Error extracting Wikipedia content: {e}")
+    
+    def _extract_google_sections(self, page, content_parts):
+        """Google search results"""
+        try:
+            # Get search query
+            search_box = page.locator("textarea[name='q'], input[name='q']").first
+            if search_box:
+                query = search_box.get_attribute("value")
+                if query:
+                    content_parts.append(f"Search Query: {query}")
+            
+            # Get result stats
+            stats = page.locator("#result-stats").first
+            if stats:
+                stats_text = stats.inner_text()
+                if stats_text:
+                    content_parts.append(f"Search Statistics: {stats_text}")
+            
+            # Get search result snippets
+            snippets = self._visible_texts(page, ".VwiC3b, .MUxGbd, .lyLwlc, .g .VwiC3b", 5)
+            for i, text in enumerate(snippets):
+                if text and len(text.strip()) > 20:
+                    content_parts.append(f"Result {i+1}: {_truncate(text, 200)}")
+        except Exception as e:
+            print(f"Error extracting Google content: {e}")
+    
+    def _extract_amazon_sections(self, page, content_parts):
+        """Amazon product or search page"""
+        try:
+            if SELECTOLAX_AVAILABLE:
+                self._extract_amazon_from_html(HTMLParser(page.content()), content_parts)
+                return
+            
+            # Check if it's a product page
+            product_title = page.locator("#productTitle, .a-size-large").first
+            if product_title.is_visible():
+                title = product_title.inner_text()
+                if title:
+                    content_parts.append(f"Product: {_truncate(title, 200)}")
+                
+                # Get price
+                price = page.locator(".a-price-whole, .a-price .a-offscreen").first
+                if price.is_visible():
+                    price_text = price.inner_text()
+                    if price_text:
+                        content_parts.append(f"Price: {price_text}")
+                
+                # Get rating
+                rating = page.locator(".a-icon-alt, #acrPopover .a-size-base").first
+                if rating.is_visible():
+                    rating_text = rating.inner_text()
+                    if rating_text:
+                        content_parts.append(f"Rating: {rating_text}")
+                
+                # Get product description
+                desc = page.locator("#productDescription, #feature-bullets").first
+                if desc.is_visible():
+                    desc_text = desc.inner_text()
+                    if desc_text:
+                        content_parts.append(f"Description: {_truncate(desc_text, 200)}")
+            else:
+                # Search results page
+                search_box = page.locator("#twotabsearchtextbox").first
+                if search_box:
+                    query = search_box.get_attribute("value")
+                    if query:
+                        content_parts.append(f"Search: {query}")
+                
+                # Get result count
+                result_count = page.locator(".a-section.a-spacing-small.a-spacing-top-small span").first
+                if result_count.is_visible():
+                    count_text = result_count.inner_text()
+                    if count_text:
+                        content_parts.append(f"Results: {count_text}")
+                
+                # Get first few product titles
+                products = self._visible_texts(page, ".s-result-item h2 a span, .a-size-medium.a-color-base.a-text-normal", 5)
+                for i, text in enumerate(products):
+                    if text:
+                        content_parts.append(f"Product {i+1}: {_truncate(text, 150)}")
+        except Exception as e:
+            print(f"Error extracting Amazon content: {e}")
+    
+    @staticmethod
+    def _visible_texts(page, selector, limit):
+        """innerText of the visible elements among the first `limit` matches of selector"""
+        return page.evaluate(_VISIBLE_TEXTS_JS, [selector, limit])
+    
+    @staticmethod
+    def _node_text(tree, selector):
+        """Text of the first node matching selector in a parsed tree, or empty string"""
+        node = tree.css_first(selector)
+        return node.text(strip=True) if node else ""
+    
+    def _extract_wikipedia_from_html(self, tree, content_parts):
+        """Wikipedia extraction from a parsed HTML snapshot (one round-trip for the page source)"""
+        title = self._node_text(tree, "#firstHeading")
+        if title:
+            content_parts.append(f"Wikipedia Article: {title}")
+        
+        # Text length stands in for the live-DOM visibility check
+        article_paragraphs = []
+        for p in tree.css(".mw-parser-output p")[:10]:
+            text = p.text()
+            if text and len(text.strip()) > 30 and not text.startswith("Jump to navigation"):
+                article_paragraphs.append(' '.join(text.split()).strip())
+        
+        if article_paragraphs:
+            content_parts.extend(article_paragraphs[:5])
+        
+        section_names = []
+        for h in tree.css(".mw-parser-output h2, .mw-parser-output h3")[:5]:
+            text = h.text(strip=True)
+            if text and "See also" not in text and "References" not in text:
+                section_names.append(text)
+        
+        if section_names:
+            content_parts.append(f"Sections include: {', '.join(section_names)}")
+    
+    def _extract_amazon_from_html(self, tree, content_parts):
+        """Amazon extraction from a parsed HTML snapshot"""
+        title = self._node_text(tree, "#productTitle, .a-size-large")
+        if title:
+            content_parts.append(f"Product: {_truncate(title, 200)}")
+            
+            price_text = self._node_text(tree, ".a-price-whole, .a-price .a-offscreen")
+            if price_text:
+                content_parts.append(f"Price: {price_text}")
+            
+            rating_text = self._node_text(tree, ".a-icon-alt, #acrPopover .a-size-base")
+            if rating_text:
+                content_parts.append(f"Rating: {rating_text}")
+            
+            desc_text = self._node_text(tree, "#productDescription, #feature-bullets")
+            if desc_text:
+                content_parts.append(f"Description: {_truncate(desc_text, 200)}")
+        else:
+            search_box = tree.css_first("#twotabsearchtextbox")
+            query = search_box.attributes.get("value") if search_box else None
+            if query:
+                content_parts.append(f"Search: {query}")
+            
+            count_text = self._node_text(tree, ".a-section.a-spacing-small.a-spacing-top-small span")
+            if count_text:
+                content_parts.append(f"Results: {count_text}")
+            
+            products = tree.css(".s-result-item h2 a span, .a-size-medium.a-color-base.a-text-normal")
+            for i, product in enumerate(products[:5]):
+                text = product.text(strip=True)
+                if text:
+                    content_parts.append(f"Product {i+1}: {_truncate(text, 150)}")
+    
+    @staticmethod
+    def _thumb_name(filename):
+        """Thumbnail filename for a screenshot (thumbnails are always JPEG)"""
+        return f"thumb_{os.path.splitext(filename)[0]}.jpg"
+    
+    def _create_thumbnail(self, image_path, thumb_path=None, size=(320, 240), image_bytes=None):
         """Create a thumbnail of the screenshot"""
         try:
             if thumb_path is None:
                 filename = os.path.basename(image_path)
-                thumb_path = os.path.join(self.screenshots_dir, f"thumb_{filename}")
+                thumb_path = os.path.join(self.screenshots_dir, self._thumb_name(filename))
             
-            with Image.open(image_path) as img:
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-                img.save(thumb_path, "PNG")
+            if CV2_AVAILABLE:
+                # INTER_AREA is the right filter for downscaling and runs as a SIMD kernel
+                if image_bytes:
+                    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+                else:
+                    img = cv2.imread(image_path, cv2.IMREAD_COLOR)
+                height, width = img.shape[:2]
+                scale = min(size[0] / width, size[1] / height, 1.0)
+                thumb_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+                thumb = cv2.resize(img, thumb_size, interpolation=cv2.INTER_AREA)
+                cv2.imwrite(thumb_path, thumb, [cv2.IMWRITE_JPEG_QUALITY, 70])
+            else:
+                source = io.BytesIO(image_bytes) if image_bytes else image_path
+                with Image.open(source) as img:
+                    img.thumbnail(size, Image.Resampling.LANCZOS)
+                    img.convert("RGB").save(thumb_path, "JPEG", quality=70)
             
             return thumb_path
         except Exception as e:
             print(f"[ScreenshotCapture] Failed to create thumbnail: {e}")
             return None
     
-    def _analyze_page(self, page, description="", is_final_result=False):
+    def _analyze_page(self, page, description="", is_final_result=False, basics=None, captured_at=None):
         """Analyze page content and return summary"""
         try:
-            url = page.url
-            title = page.title() or "No title"
+            if basics is None:
+                basics = self._read_page_basics(page)
+            url = basics["url"]
+            title = basics["title"] or "No title"
             
             # Get page text for analysis
-            page_text = page.inner_text("body")[:1000] if page.inner_text("body") else ""
+            page_text = basics["text"] or ""
             
             # Clean text
-            page_text = re.sub(r'\s+', ' ', page_text)
+            page_text = ' '.join(page_text.split())
             
             # Basic analysis
             analysis = {
                 "url": url,
                 "title": title,
                 "description": description,
-                "text_preview": page_text[:300] + "..." if len(page_text) > 300 else page_text,
-                "timestamp": datetime.now().isoformat()
+                "text_preview": _truncate(page_text, 300),
+                "timestamp": (captured_at or datetime.now()).isoformat()
             }
             
             # Add site-specific analysis
-            if "wikipedia.org" in url.lower():
-                analysis["site"] = "wikipedia"
-                analysis["summary"] = f"Wikipedia article: {title}"
-            elif "google.com" in url.lower():
-                analysis["site"] = "google"
-                analysis["summary"] = f"Google page: {title}"
-            elif "amazon.com" in url.lower() or "amazon.in" in url.lower():
-                analysis["site"] = "amazon"
-                analysis["summary"] = f"Amazon page: {title}"
-            elif "youtube.com" in url.lower():
-                analysis["site"] = "youtube"
-                analysis["summary"] = f"YouTube: {title}"
-            elif "linkedin.com" in url.lower():
-                analysis["site"] = "linkedin"
-                analysis["summary"] = f"LinkedIn: {title}"
-            elif "twitter.com" in url.lower() or "x.com" in url.lower():
-                analysis["site"] = "twitter"
-                analysis["summary"] = f"Twitter/X: {title}"
-            else:
-                analysis["site"] = "generic"
-                analysis["summary"] = f"Page: {title}"
+            site = _detect_site(url)
+            analysis["site"] = site
+            analysis["summary"] = f"{_SITE_SUMMARY_LABELS[site]}: {title}"
             
             return analysis
             
@@ -502,20 +863,50 @@ Summary:"""
     
     def get_all_screenshots(self, report_id):
         """Get all screenshots for a specific report"""
-        screenshots = []
+        if report_id not in self._index:
+            self._index[report_id] = self._scan_screenshots(report_id)
         
-        if os.path.exists(self.screenshots_dir):
-            for filename in os.listdir(self.screenshots_dir):
-                if report_id in filename and filename.endswith('.png'):
-                    if not filename.startswith('thumb_'):
-                        screenshots.append({
-                            "filename": filename,
-                            "path": os.path.join(self.screenshots_dir, filename),
-                            "thumbnail": f"thumb_{filename}" if os.path.exists(os.path.join(self.screenshots_dir, f"thumb_{filename}")) else filename
-                        })
+        return list(self._index[report_id])
+    
+    def _scan_screenshots(self, report_id):
+        """List a report's screenshots with a single directory scan"""
+        if not os.path.exists(self.screenshots_dir):
+            return []
+        
+        with os.scandir(self.screenshots_dir) as entries:
+            names = [entry.name for entry in entries]
+        existing = set(names)
+        
+        screenshots = []
+        for filename in names:
+            if report_id in filename and filename.endswith(SCREENSHOT_EXTENSIONS):
+                if not filename.startswith('thumb_'):
+                    thumb_filename = self._thumb_name(filename)
+                    screenshots.append(self._index_entry(
+                        filename, thumb_filename if thumb_filename in existing else None
+                    ))
         
         return screenshots
     
+    def _index_entry(self, filename, thumb_filename):
+        """Build a get_all_screenshots entry for a screenshot file"""
+        return {
+            "filename": filename,
+            "path": os.path.join(self.screenshots_dir, filename),
+            "thumbnail": thumb_filename or filename
+        }
+    
+    def _index_add(self, filename, thumb_filename):
+        """Add a new screenshot to every cached listing it belongs to"""
+        for report_id, screenshots in self._index.items():
+            if report_id in filename:
+                screenshots.append(self._index_entry(filename, thumb_filename))
+    
+    def _index_remove(self, filename):
+        """Drop a deleted screenshot from the cached listings"""
+        for report_id, screenshots in self._index.items():
+            self._index[report_id] = [s for s in screenshots if s["filename"] != filename]
+    
     def get_screenshot_as_base64(self, filename):
         """Get screenshot as base64 string"""
         filepath = os.path.join(self.screenshots_dir, filename)
@@ -524,8 +915,13 @@ Summary:"""
             return None
         
         try:
+            # Encode in 48 KB chunks (a multiple of 3 bytes, so no padding in between)
+            # instead of holding the raw file and its encoding in memory together
+            encoded = bytearray()
             with open(filepath, 'rb') as f:
-                return base64.b64encode(f.read()).decode('utf-8')
+                while chunk := f.read(49152):
+                    encoded.extend(base64.b64encode(chunk))
+            return encoded.decode('ascii')
         except Exception as e:
             print(f"[ScreenshotCapture] Failed to encode screenshot: {e}")
             return None
@@ -539,10 +935,11 @@ Summary:"""
                 os.remove(filepath)
                 
                 # Also delete thumbnail if exists
-                thumb_path = os.path.join(self.screenshots_dir, f"thumb_{filename}")
+                thumb_path = os.path.join(self.screenshots_dir, self._thumb_name(filename))
                 if os.path.exists(thumb_path):
                     os.remove(thumb_path)
                 
+                self._index_remove(filename)
                 return True
             except Exception as e:
                 print(f"[ScreenshotCapture] Failed to delete {filename}: {e}")
@@ -9,15 +9,19 @@ UPDATED: Gemini API support for intelligent summarization
 FIXED: Removed attribute access that caused 'list' object has no attribute '__dict__' error
 """
 
-from playwright.sync_api import sync_playwright
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional
 import re
 from datetime import datetime
+import atexit
+import io
+from functools import lru_cache
+from itertools import islice
 import os
 import sys
 import traceback
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
@@ -31,6 +35,574 @@ except ImportError as e:
     SCREENSHOT_MODULE_AVAILABLE = False
     print(f"[Executor] Screenshot capture module not available: {e}")
 
+# Optional Aho-Corasick automaton for matching all validation phrases in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional RE2 (linear-time DFA matching) for the validation regexes; plain re otherwise
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+_validation_re = re2 if RE2_AVAILABLE else re
+
+
+# Set EXECUTOR_DEBUG=1 to print full tracebacks for failed steps
+EXECUTOR_DEBUG = os.getenv("EXECUTOR_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Step statuses as produced by every _execute_* handler (compared case-sensitively)
+STATUS_PASSED = "Passed"
+STATUS_FAILED = "Failed"
+
+# Actions whose failure does not stop the run
+NON_BLOCKING_ACTIONS = frozenset({"wait", "validate_page", "info", "generate_data"})
+
+# Characters that mark a validation pattern as a regex rather than a plain phrase
+REGEX_METACHARS = frozenset(r".\*+?[](){}|^$")
+
+# Page content for result analysis, gathered in-page by one page.evaluate:
+# title, then the Google snippets / Wikipedia article / Amazon product parts of the
+# extractor picked by hostname, then up to 2 visible elements per content selector
+# until 3 parts are collected
+# (paragraphs as fallback). With none, the start of the body text is returned.
+_PAGE_CONTENT_JS = r"""
+() => {
+    const CONTENT_SELECTORS = [
+        "main", "article", "#main", ".main-content", ".content",
+        "#search", ".search-results", "#results", ".results",
+        "#bodyContent", ".mw-parser-output", "#mw-content-text",
+        ".g", ".srg", "#res", "#rcnt",
+        "div[role='main']", ".post-content", ".entry-content"
+    ];
+    const isVisible = (el) => {
+        if (!el || !el.getClientRects().length) return false;
+        return getComputedStyle(el).visibility !== "hidden";
+    };
+    const clean = (text) => text.replace(/\s+/g, " ");
+    const MAX_PARTS = 3;
+    const parts = [];
+
+    // Site-specific extractors, keyed by the site name in the hostname
+    const SITE_EXTRACTORS = {
+        google: () => {
+            for (const el of Array.from(document.querySelectorAll(".VwiC3b, .MUxGbd, .lyLwlc")).slice(0, 3)) {
+                if (parts.length >= MAX_PARTS) break;
+                if (isVisible(el) && el.innerText) parts.push("Search result: " + el.innerText.slice(0, 200) + "...");
+            }
+        },
+        wikipedia: () => {
+            const heading = document.querySelector("#firstHeading");
+            if (isVisible(heading)) parts.push("Wikipedia Article: " + heading.innerText);
+            for (const p of Array.from(document.querySelectorAll(".mw-parser-output p")).slice(0, 3)) {
+                if (parts.length >= MAX_PARTS) break;
+                if (!isVisible(p) || !p.innerText) continue;
+                const text = clean(p.innerText);
+                parts.push(text.length > 200 ? text.slice(0, 200) + "..." : text);
+            }
+        },
+        amazon: () => {
+            const product = document.querySelector("#productTitle, .a-size-large");
+            if (isVisible(product) && product.innerText) parts.push("Product: " + product.innerText.trim());
+            const desc = document.querySelector("#productDescription, .a-spacing-small");
+            if (parts.length < MAX_PARTS && isVisible(desc) && desc.innerText) {
+                parts.push(desc.innerText.trim().slice(0, 200) + "...");
+            }
+        },
+    };
+
+    const title = document.title;
+    if (title && title.trim()) parts.push("Page Title: " + title);
+
+    // Site-specific parts first: they are the most relevant when the host matches.
+    // One hostname match picks the extractor instead of a substring test per site.
+    const site = /(?:^|\.)(google|wikipedia|amazon)\.[a-z.]+$/.exec(location.hostname.toLowerCase());
+    if (site) SITE_EXTRACTORS[site[1]]();
+
+    // Generic sweep only fills whatever room is left
+    for (const sel of CONTENT_SELECTORS) {
+        if (parts.length >= MAX_PARTS) break;
+        for (const el of Array.from(document.querySelectorAll(sel)).slice(0, 2)) {
+            if (parts.length >= MAX_PARTS) break;
+            if (!isVisible(el)) continue;
+            const text = el.innerText;
+            if (text && text.trim().length > 50) parts.push(clean(text).trim());
+        }
+    }
+
+    if (!parts.length) {
+        for (const p of Array.from(document.querySelectorAll("p")).slice(0, 5)) {
+            if (parts.length >= MAX_PARTS) break;
+            if (!isVisible(p)) continue;
+            const text = p.innerText;
+            if (text && text.trim().length > 30) parts.push(clean(text).trim());
+        }
+    }
+
+    if (parts.length) return parts.join("\n\n");
+
+    if (!document.body) return "Page loaded successfully";
+    const body = clean(document.body.innerText);
+    return body.length > 500 ? body.slice(0, 500) + "..." : body;
+}
+"""
+
+# LinkedIn signup success indicators (enhanced)
+_LINKEDIN_SIGNUP_INDICATORS = (
+    "check your email",
+    "verify your account",
+    "enter the code",
+    "enter code",
+    "enter confirmation code",
+    "we sent a code",
+    "verification",
+    "confirm your email",
+    "check your inbox",
+    "email sent",
+    "confirmation code",
+    "we've sent a code",
+    "enter the 6-digit code",
+    "confirm it's you",
+    "enter the verification code",
+    "verify it's you",
+)
+
+_WIKIPEDIA_INDICATORS = (
+    "wikipedia, the free encyclopedia",
+    "from wikipedia",
+    "main page",
+    "contents",
+    "article",
+    "talk",
+    "read",
+    "edit",
+    "view history",
+    "search",
+    "create account",
+    "log in",
+    "/wiki/",
+)
+
+# Search success indicators checked after a search (the query itself is added per call)
+_SEARCH_INDICATORS = (
+    "results", "search", "showing", "did you mean",
+    "related searches", "no results found", "no matches",
+)
+
+# Click strategies built from the target text, in priority order
+_CLICK_TEXT_TEMPLATES = (
+    "button:has-text('{0}')",
+    "a:has-text('{0}')",
+    "div[role='button']:has-text('{0}')",
+    "span:has-text('{0}')",
+    "input[value='{0}']",
+)
+_LINKEDIN_JOIN_SELECTORS = ("button:has-text('Agree & Join')", "button:has-text('Join now')")
+_LINKEDIN_EMAIL_SELECTORS = ("input[name='email-address']", "input[id='email-address']")
+
+# Text scanned by page validation: visible body text followed by the URL (which
+# carries markers such as "/wiki/"), lowercased in-page so one string crosses CDP
+_VALIDATION_TEXT_JS = """
+() => ((document.body ? document.body.innerText : "") + " " + location.href).toLowerCase()
+"""
+
+# Whitespace-collapsed text of the visible elements among the first `limit`
+# matches, keeping texts longer than `minLength` (for locator.evaluate_all)
+_VISIBLE_TEXTS_OF_JS = r"""
+(elements, [limit, minLength]) => elements
+    .slice(0, limit)
+    .filter((el) => el.getClientRects().length && getComputedStyle(el).visibility !== "hidden")
+    .map((el) => (el.innerText || "").replace(/\s+/g, " ").trim())
+    .filter((text) => text && text.length > minLength)
+"""
+
+# Number of lowercase indicators found in the page's body text
+_COUNT_TEXT_INDICATORS_JS = """
+(indicators) => {
+    const text = document.body ? document.body.innerText.toLowerCase() : "";
+    return indicators.filter((indicator) => text.includes(indicator)).length;
+}
+"""
+
+# Focus, clear, set and verify an input in one round-trip. The native value setter
+# is used so React-controlled inputs see the change through their input event.
+_FILL_AND_VERIFY_JS = """
+(el, value) => {
+    if (!(el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement)) return false;
+    if (el.disabled || el.readOnly) return false;
+    el.scrollIntoView({block: 'center'});
+    el.focus();
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    const setValue = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    setValue.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return el.value === value;
+}
+"""
+
+
+# Selectors with priorities - UPDATED WITH BETTER LINKEDIN SUPPORT
+FIELD_SELECTORS = MappingProxyType({
+    "search": (
+        "#searchInput",  # Wikipedia
+        "input[name='search']",  # Wikipedia and many others
+        "#twotabsearchtextbox",  # Amazon
+        "#search",  # Common search ID
+        ".search-input",  # Common search class
+        "input[type='search']",  # HTML5 search type
+        "input[name='q']",  # Google, Flipkart
+        "textarea[name='q']",  # Google
+        "input[name='search_query']",  # YouTube
+        "input[placeholder*='Search' i]",
+        "input[title='Search']",
+        "input[type='text']",
+        "input"
+    ),
+    "email": (
+        "input[name='email-address']",  # LinkedIn signup - PRIORITIZED
+        "input[type='email']",
+        "input[name='email']",
+        "input[name='session_key']",  # LinkedIn login
+        "input[name='reg_email__']",  # Facebook
+        "input[id='email']",
+        "input[placeholder*='email' i]",
+        "input[autocomplete='email']",
+    ),
+    "username": (
+        "input[autocomplete='username']",  # Twitter/X login
+        "input[name='text']",  # Twitter/X
+        "input[type='text']",  # Generic
+        "input[name='username']",
+        "input[name='session_username']",
+        "input[id='username']",
+        "input[placeholder*='username' i]",
+        "input[placeholder*='Phone' i]",
+    ),
+    "password": (
+        "input[type='password']",
+        "input[name='pass']",  # Facebook
+        "input[name='password']",
+        "input[name='session_password']",  # LinkedIn
+        "input[name='reg_passwd__']",  # Facebook
+        "input[placeholder*='password' i]",
+        "input[autocomplete='new-password']",  # Signup forms
+    ),
+    "name": (
+        "input[name='name']",  # Twitter/X
+        "input[data-testid*='name']",  # Twitter/X signup
+        "input[placeholder*='name' i]",
+        "input[placeholder*='Full name' i]",
+    ),
+    "first_name": (
+        "input[name='first-name']",  # LinkedIn - PRIORITIZED
+        "input[id='first-name']",  # LinkedIn
+        "input[name='firstname']",  # Facebook
+        "input[name='firstName']",
+        "input[placeholder*='first name' i]",
+    ),
+    "last_name": (
+        "input[name='last-name']",  # LinkedIn - PRIORITIZED
+        "input[id='last-name']",  # LinkedIn
+        "input[name='lastname']",  # Facebook
+        "input[name='lastName']",
+        "input[placeholder*='last name' i]",
+    )
+})
+
+ACTION_SELECTORS = MappingProxyType({
+    "login_button": (
+        "button[name='login']",  # Facebook
+        "button:has-text('Log in')",
+        "button:has-text('Sign in')",
+        "button[type='submit']",  # Twitter/X, LinkedIn
+        "button[data-testid*='Login']",  # Twitter/X
+        "div[role='button']:has-text('Log in')",
+        "input[type='submit'][value='Sign in']",  # LinkedIn
+    ),
+    "signup_button": (
+        "a[data-testid='open-registration-form-button']",  # Facebook
+        "a:has-text('Create New Account')",
+        "a:has-text('Sign up')",
+        "button:has-text('Sign up')",
+        "button:has-text('Create account')",
+        "button:has-text('Join')",  # Twitter/X
+        "button:has-text('Agree & Join')",  # LinkedIn - PRIORITIZED
+        "button:has-text('Join now')",  # LinkedIn
+    ),
+    "submit_button": (
+        "button[name='websubmit']",  # Facebook
+        "button[type='submit']",
+        "button:has-text('Next')",
+        "button:has-text('Continue')",
+        "button:has-text('Submit')",
+    ),
+    "next_button": (
+        "button:has-text('Next')",
+        "div[role='button']:has-text('Next')",
+        "button[type='submit']",  # Twitter/X Next is often submit button
+        "span:has-text('Next')",
+    ),
+    "add_to_cart": (
+        "#add-to-cart-button",  # Amazon
+        "button:has-text('Add to Cart' i)",
+        "input[value='Add to Cart']",
+        "button[id*='add-to-cart' i]",
+        "button[class*='add-to-cart' i]",
+    ),
+    "search_button": (
+        "#searchButton",  # Wikipedia
+        ".search-button",  # Common search button
+        "button[aria-label*='search' i]",  # Accessibility label
+        "input[type='submit'][value='Google Search']",
+        "button[type='submit']",
+        "input[value='Search']",
+        "button:has-text('Search')",
+        "input[type='submit'][value*='Search' i]",
+    )
+})
+
+# Validation patterns - ENHANCED WITH BETTER LINKEDIN SUPPORT
+VALIDATION_PATTERNS = MappingProxyType({
+    "login_success": (
+        r"@[a-zA-Z0-9_]{1,15}",  # @username (Twitter/X)
+        "profile",
+        "logout", 
+        "sign out", 
+        "settings", 
+        "account", 
+        "dashboard",
+        r"welcome,\s*[a-zA-Z]",  # Welcome, John
+        "inbox", 
+        "notifications", 
+        "feed", 
+        "home\s*\(\d+\)",  # Home(12)
+        "my network",  # LinkedIn
+        "messaging",  # LinkedIn
+        "jobs",  # LinkedIn
+    ),
+    "login_failure": (
+        "incorrect password", 
+        "wrong password", 
+        "invalid",
+        "account not found", 
+        "doesn't match", 
+        "try again",
+        "enter your password",
+        "forgot password",
+        "unable to sign in",
+    ),
+    "signup_success": (
+        "check your email",  # LinkedIn - TOP PRIORITY
+        "verify your account",  # LinkedIn
+        "enter the code",  # LinkedIn
+        "enter code",  # LinkedIn
+        "enter confirmation code",  # Twitter/X
+        "we sent you a code",  # Twitter/X
+        "verify your email", 
+        "confirm your email", 
+        "check your inbox",
+        "account created", 
+        "registration complete", 
+        "welcome to",
+        "almost done", 
+        "verify account",
+        "email sent",
+        "verification code",
+        "confirmation code",
+        "we've sent a code",
+        "enter the verification code",
+        "enter the 6-digit code",
+    ),
+    "signup_failure": (
+        "email already exists", 
+        "invalid email", 
+        "password too weak",
+        "phone number invalid", 
+        "birthday invalid", 
+        "already registered",
+        "someone already has that",
+        "enter a valid email",
+        "password must be",
+        "this email is already linked",
+        "account already exists",
+        "use a different email",
+        "try another email",
+    ),
+    "shopping_success": (
+        "added to cart", 
+        "added to your cart", 
+        "item in cart",
+        "cart\s*\(\d+\)", 
+        "proceed to checkout", 
+        "checkout",
+        "buy now",
+        "place order",
+    ),
+    "search_success": (
+        "results",
+        "search results",
+        "showing results for",
+        "did you mean",
+        "related searches",
+        "search for",
+        "page you were looking",
+        "article",
+        "contents",
+        "references",
+        "edit this page",
+        "talk",
+        "view history",
+        "no results found",
+        "no exact matches",
+        "try different keywords",
+        "sorry, we couldn't find",
+        "wikipedia, the free encyclopedia",
+        "from wikipedia",
+        "this article is about",
+        "jump to navigation",
+        "main page",
+    )
+})
+
+# Signup failure phrase -> reason shown in the step details (first match wins)
+_SIGNUP_ERROR_MESSAGES = MappingProxyType({
+    "email already exists": "Email already exists",
+    "account already exists": "Email already exists",
+    "password too weak": "Password too weak",
+    "password must be": "Password too weak",
+})
+
+# Each priority list as one ":visible" union selector, so waiting for any candidate
+# is a single Playwright query instead of one round-trip (and timeout) per
+# alternative. Only a probe: .first on a union is the first match in DOM order,
+# not the first selector in priority order (see _first_visible_selector)
+def _join_selectors(selectors):
+    """Combine a selector priority list into one union matching visible elements only"""
+    return ", ".join(f"{sel}:visible" for sel in selectors)
+
+
+FIELD_SELECTORS_JOINED = MappingProxyType({k: _join_selectors(v) for k, v in FIELD_SELECTORS.items()})
+
+# Fallback typing target: visible inputs a user could type into
+GENERIC_INPUT_SELECTOR = (
+    "input:visible:not([type='hidden']):not([type='submit']):not([type='button'])"
+    ":not([type='checkbox']):not([type='radio']):not([disabled]):not([readonly])"
+)
+
+# Cookie consent buttons: button-text matches first, then ids/classes/labels
+COOKIE_TEXT_UNION = _join_selectors((
+    "button:has-text('Accept all cookies')",
+    "button:has-text('Accept cookies')",
+    "button:has-text('I accept')",
+    "button:has-text('Agree')",
+    "button:has-text('Accept all')",
+))
+COOKIE_CSS_UNION = _join_selectors((
+    ".accept-cookies",
+    "#accept-cookies",
+    "button[aria-label*='cookie' i]",
+    "button[aria-label*='accept' i]",
+    "#sp-cc-accept",  # Amazon cookie banner
+))
+
+# Compile each validation pattern once at import: regexes become compiled objects,
+# plain phrases are matched with a substring check on the lowercased page. The page
+# text is lowercased in-page, so regexes are compiled case-sensitively (no
+# IGNORECASE, which would keep sre from its fast literal-prefix search). They
+# have no backreferences or lookarounds, so RE2 can run them when installed.
+_COMPILED_VALIDATION = MappingProxyType({
+    category: tuple(
+        (_validation_re.compile(p), None) if any(c in p for c in REGEX_METACHARS) else (None, p.lower())
+        for p in patterns
+    )
+    for category, patterns in VALIDATION_PATTERNS.items()
+})
+
+# @handles shown on a logged-in Twitter/X page
+_TWITTER_HANDLE_RE = _validation_re.compile(r"@[a-zA-Z0-9_]+")
+
+
+# Every plain phrase page validation looks for (pattern categories plus the LinkedIn
+# and Wikipedia indicators), so a page is scanned once for all of them
+_SCAN_LITERALS = tuple(dict.fromkeys((
+    *(literal for compiled in _COMPILED_VALIDATION.values() for regex, literal in compiled if regex is None),
+    *_LINKEDIN_SIGNUP_INDICATORS,
+    *_WIKIPEDIA_INDICATORS,
+)))
+
+
+def _trie_regex(words):
+    """Regex alternation of words factored through a character trie (longest word wins at a position)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    
+    def walk(node):
+        branches = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+    
+    return walk(trie)
+
+
+def _phrase_scanner(phrases):
+    """Function returning the set of phrases found in a lowercase text, in one pass over the text"""
+    phrases = tuple(dict.fromkeys(phrase for phrase in phrases if phrase))
+    if not phrases:
+        return lambda text: set()
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for phrase in phrases:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        return lambda text: {phrase for _, phrase in automaton.iter(text)}
+    
+    # Without pyahocorasick: one lookahead regex reports the longest phrase starting at
+    # each position; the phrases that are prefixes of it start there as well (plain
+    # re on purpose, RE2 has no lookarounds)
+    scan_re = re.compile(f"(?=({_trie_regex(phrases)}))")
+    prefixes = {phrase: tuple(other for other in phrases if phrase.startswith(other)) for phrase in phrases}
+    
+    def scan(text):
+        found = set()
+        for match in scan_re.finditer(text):
+            found.update(prefixes[match.group(1)])
+        return found
+    
+    return scan
+
+
+_scan_validation_literals = _phrase_scanner(_SCAN_LITERALS)
+
+
+@lru_cache(maxsize=256)
+def _text_indicator_scanner(text):
+    """(indicator, lowercased indicator) pairs of a validate step's text, with a scanner for them"""
+    indicators = tuple((indicator, indicator.lower()) for indicator in (t.strip() for t in text.split(",")))
+    return indicators, _phrase_scanner(lowered for _, lowered in indicators)
+
+
+class StepRecord(NamedTuple):
+    """Compact per-step record kept in execution_steps; _asdict() gives the plain dict"""
+    step: int
+    action: str
+    status: str
+    description: str = ""
+    details: str = ""
+    screenshot: Optional[str] = None
+    duration: float = 0
+    result_content: Optional[str] = None
+
 
 class UniversalExecutor:
     """
@@ -41,14 +613,51 @@ class UniversalExecutor:
     FIXED: Removed attribute access that caused 'list' object has no attribute '__dict__' error
     """
     
-    def __init__(self, reports_dir="reports", api_key=None):
+    # Request types aborted when block_assets is on. Stylesheets are kept: visibility
+    # checks and step screenshots depend on the page being laid out normally.
+    BLOCKED_RESOURCE_TYPES = frozenset({
+        "image", "media", "font", "texttrack", "beacon", "csp_report", "imageset"
+    })
+    
+    # Seconds the final step waits for the background Gemini result summary
+    GEMINI_SUMMARY_TIMEOUT = 15
+    
+    # URL -> execution_state["current_site"], one regex pass per navigate
+    _SITE_RE = re.compile(r"(linkedin|twitter|\bx\.com|facebook|wikipedia|google)", re.I)
+    _SITE_MAP = {
+        "linkedin": "linkedin",
+        "twitter": "twitter",
+        "x.com": "twitter",
+        "facebook": "facebook",
+        "wikipedia": "wikipedia",
+        "google": "search_engine"
+    }
+    
+    # URL -> key of self._site_validators
+    _SITE_VALIDATOR_RE = re.compile(r"(linkedin\.com|wikipedia\.org)")
+    
+    # Browser shared by all executors created with share_browser=True
+    _shared = {}
+    
+    def __init__(self, reports_dir="reports", api_key=None, block_assets=True, screenshot_budget_ms=3000,
+                 share_browser=False):
         # Track random data usage for reporting
         self.generated_data = {}
         self.used_provided_data = {}
         self.page = None  # Store page reference for screenshot capture
         self.context = None
         self.browser = None
+        self._playwright = None  # Started on first run(), shared by later runs until close()
+        self._browser_headless = None
+        self._locator_cache = {}  # selector string -> Locator for the current document
+        # Console lines of the running step, written out in one go per step; only
+        # this executor writes here, so concurrent runs never share a buffer
+        self._step_log = io.StringIO()
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.block_assets = block_assets
+        # Playwright's sync API is bound to one thread, so sharing is opt-in
+        # (batch runs in one thread); the web app keeps a browser per executor
+        self.share_browser = share_browser
         
         # Screenshot capture system
         self.screenshot_capture = None
@@ -57,7 +666,9 @@ class UniversalExecutor:
         # Initialize screenshot capture if available
         if SCREENSHOT_MODULE_AVAILABLE:
             try:
-                self.screenshot_capture = ScreenshotCapture(reports_dir, api_key=self.api_key)
+                self.screenshot_capture = ScreenshotCapture(
+                    reports_dir, api_key=self.api_key, screenshot_budget_ms=screenshot_budget_ms
+                )
                 print("[Executor] Screenshot capture initialized")
             except Exception as e:
                 print(f"[Executor] Failed to initialize screenshot capture: {e}")
@@ -83,227 +694,34 @@ class UniversalExecutor:
             "result_summary": None
         }
         
-        # Selectors with priorities - UPDATED WITH BETTER LINKEDIN SUPPORT
-        self.field_selectors = {
-            "search": [
-                "#searchInput",  # Wikipedia
-                "input[name='search']",  # Wikipedia and many others
-                "#twotabsearchtextbox",  # Amazon
-                "#search",  # Common search ID
-                ".search-input",  # Common search class
-                "input[type='search']",  # HTML5 search type
-                "input[name='q']",  # Google, Flipkart
-                "textarea[name='q']",  # Google
-                "input[name='search_query']",  # YouTube
-                "input[placeholder*='Search' i]",
-                "input[title='Search']",
-                "input[type='text']",
-                "input"
-            ],
-            "email": [
-                "input[name='email-address']",  # LinkedIn signup - PRIORITIZED
-                "input[type='email']",
-                "input[name='email']",
-                "input[name='session_key']",  # LinkedIn login
-                "input[name='reg_email__']",  # Facebook
-                "input[id='email']",
-                "input[placeholder*='email' i]",
-                "input[autocomplete='email']",
-            ],
-            "username": [
-                "input[autocomplete='username']",  # Twitter/X login
-                "input[name='text']",  # Twitter/X
-                "input[type='text']",  # Generic
-                "input[name='username']",
-                "input[name='session_username']",
-                "input[id='username']",
-                "input[placeholder*='username' i]",
-                "input[placeholder*='Phone' i]",
-            ],
-            "password": [
-                "input[type='password']",
-                "input[name='pass']",  # Facebook
-                "input[name='password']",
-                "input[name='session_password']",  # LinkedIn
-                "input[name='reg_passwd__']",  # Facebook
-                "input[placeholder*='password' i]",
-                "input[autocomplete='new-password']",  # Signup forms
-            ],
-            "name": [
-                "input[name='name']",  # Twitter/X
-                "input[data-testid*='name']",  # Twitter/X signup
-                "input[placeholder*='name' i]",
-                "input[placeholder*='Full name' i]",
-            ],
-            "first_name": [
-                "input[name='first-name']",  # LinkedIn - PRIORITIZED
-                "input[id='first-name']",  # LinkedIn
-                "input[name='firstname']",  # Facebook
-                "input[name='firstName']",
-                "input[placeholder*='first name' i]",
-            ],
-            "last_name": [
-                "input[name='last-name']",  # LinkedIn - PRIORITIZED
-                "input[id='last-name']",  # LinkedIn
-                "input[name='lastname']",  # Facebook
-                "input[name='lastName']",
-                "input[placeholder*='last name' i]",
-            ]
-        }
+        # Read-only reference data shared by every executor (built at import)
+        self.field_selectors = FIELD_SELECTORS
+        self.action_selectors = ACTION_SELECTORS
+        self.validation_patterns = VALIDATION_PATTERNS
+        self.field_selectors_joined = FIELD_SELECTORS_JOINED
+        self._compiled_patterns = _COMPILED_VALIDATION
+        self._scan_literals = _scan_validation_literals
+        self._literal_scan = (None, set())
+        self._wikipedia_extract = (None, None, None)
         
-        self.action_selectors = {
-            "login_button": [
-                "button[name='login']",  # Facebook
-                "button:has-text('Log in')",
-                "button:has-text('Sign in')",
-                "button[type='submit']",  # Twitter/X, LinkedIn
-                "button[data-testid*='Login']",  # Twitter/X
-                "div[role='button']:has-text('Log in')",
-                "input[type='submit'][value='Sign in']",  # LinkedIn
-            ],
-            "signup_button": [
-                "a[data-testid='open-registration-form-button']",  # Facebook
-                "a:has-text('Create New Account')",
-                "a:has-text('Sign up')",
-                "button:has-text('Sign up')",
-                "button:has-text('Create account')",
-                "button:has-text('Join')",  # Twitter/X
-                "button:has-text('Agree & Join')",  # LinkedIn - PRIORITIZED
-                "button:has-text('Join now')",  # LinkedIn
-            ],
-            "submit_button": [
-                "button[name='websubmit']",  # Facebook
-                "button[type='submit']",
-                "button:has-text('Next')",
-                "button:has-text('Continue')",
-                "button:has-text('Submit')",
-            ],
-            "next_button": [
-                "button:has-text('Next')",
-                "div[role='button']:has-text('Next')",
-                "button[type='submit']",  # Twitter/X Next is often submit button
-                "span:has-text('Next')",
-            ],
-            "add_to_cart": [
-                "#add-to-cart-button",  # Amazon
-                "button:has-text('Add to Cart' i)",
-                "input[value='Add to Cart']",
-                "button[id*='add-to-cart' i]",
-                "button[class*='add-to-cart' i]",
-            ],
-            "search_button": [
-                "#searchButton",  # Wikipedia
-                ".search-button",  # Common search button
-                "button[aria-label*='search' i]",  # Accessibility label
-                "input[type='submit'][value='Google Search']",
-                "button[type='submit']",
-                "input[value='Search']",
-                "button:has-text('Search')",
-                "input[type='submit'][value*='Search' i]",
-            ]
+        # Step dispatch table: every handler takes (page, action_data)
+        self._handlers = {
+            "navigate": self._execute_navigate,
+            "search": self._execute_search,
+            "type": lambda page, a: self._execute_type(page, a, a.get("field_type", "")),
+            "select": lambda page, a: self._execute_select(page, a, a.get("field_type", "")),
+            "click": self._execute_click,
+            "wait": self._execute_wait,
+            # Pass execution_state to validation - FIX: Pass as dictionary, not as object attribute
+            "validate_page": lambda page, a: self._execute_validate_page(page, a, self.execution_state),
+            "info": self._execute_info,
+            "generate_data": self._execute_generate_data,
         }
         
-        # Validation patterns - ENHANCED WITH BETTER LINKEDIN SUPPORT
-        self.validation_patterns = {
-            "login_success": [
-                r"@[a-zA-Z0-9_]{1,15}",  # @username (Twitter/X)
-                "profile",
-                "logout", 
-                "sign out", 
-                "settings", 
-                "account", 
-                "dashboard",
-                r"welcome,\s*[a-zA-Z]",  # Welcome, John
-                "inbox", 
-                "notifications", 
-                "feed", 
-                "home\s*\(\d+\)",  # Home(12)
-                "my network",  # LinkedIn
-                "messaging",  # LinkedIn
-                "jobs",  # LinkedIn
-            ],
-            "login_failure": [
-                "incorrect password", 
-                "wrong password", 
-                "invalid",
-                "account not found", 
-                "doesn't match", 
-                "try again",
-                "enter your password",
-                "forgot password",
-                "unable to sign in",
-            ],
-            "signup_success": [
-                "check your email",  # LinkedIn - TOP PRIORITY
-                "verify your account",  # LinkedIn
-                "enter the code",  # LinkedIn
-                "enter code",  # LinkedIn
-                "enter confirmation code",  # Twitter/X
-                "we sent you a code",  # Twitter/X
-                "verify your email", 
-                "confirm your email", 
-                "check your inbox",
-                "account created", 
-                "registration complete", 
-                "welcome to",
-                "almost done", 
-                "verify account",
-                "email sent",
-                "verification code",
-                "confirmation code",
-                "we've sent a code",
-                "enter the verification code",
-                "enter the 6-digit code",
-            ],
-            "signup_failure": [
-                "email already exists", 
-                "invalid email", 
-                "password too weak",
-                "phone number invalid", 
-                "birthday invalid", 
-                "already registered",
-                "someone already has that",
-                "enter a valid email",
-                "password must be",
-                "this email is already linked",
-                "account already exists",
-                "use a different email",
-                "try another email",
-            ],
-            "shopping_success": [
-                "added to cart", 
-                "added to your cart", 
-                "item in cart",
-                "cart\s*\(\d+\)", 
-                "proceed to checkout", 
-                "checkout",
-                "buy now",
-                "place order",
-            ],
-            "search_success": [
-                "results",
-                "search results",
-                "showing results for",
-                "did you mean",
-                "related searches",
-                "search for",
-                "page you were looking",
-                "article",
-                "contents",
-                "references",
-                "edit this page",
-                "talk",
-                "view history",
-                "no results found",
-                "no exact matches",
-                "try different keywords",
-                "sorry, we couldn't find",
-                "wikipedia, the free encyclopedia",
-                "from wikipedia",
-                "this article is about",
-                "jump to navigation",
-                "main page",
-            ]
+        # Site validators for _SITE_VALIDATOR_RE matches, each returns a result dict or None
+        self._site_validators = {
+            "linkedin.com": self._validate_linkedin_signup,
+            "wikipedia.org": self._validate_wikipedia,
         }
     
     def run(self, parsed_actions: List[Dict[str, Any]], headless=False, report_id=None, instruction=None) -> List[Dict[str, Any]]:
@@ -334,6 +752,7 @@ class UniversalExecutor:
         self.execution_steps = []
         self.generated_data = {}
         self.used_provided_data = {}
+        self._locator_cache.clear()
         
         # Reset execution state - use dictionary NOT object
         self.execution_state = {
@@ -347,98 +766,66 @@ class UniversalExecutor:
             "result_summary": None
         }
         
-        with sync_playwright() as p:
-            self.browser = p.chromium.launch(
-                headless=headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--start-maximized',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--no-sandbox'
-                ]
-            )
+        self._ensure_browser(headless)
+        try:
+            # Fresh context per run so cookies and logins never leak between tests
             self.context = self.browser.new_context(
                 viewport={"width": 1920, "height": 1080},
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 locale="en-US",
                 java_script_enabled=True
             )
+            if self.block_assets:
+                # Bound on the context so popups inherit it
+                self.context.route("**/*", self._route_request)
             self.page = self.context.new_page()  # Store page reference
             self.page.set_default_timeout(40000)
             
             step_number = 0
             
-            for action_data in parsed_actions:
+            for action_data in self._logged_steps(parsed_actions):
                 step_number += 1
                 action = action_data.get("action", "unknown")
                 field_type = action_data.get("field_type", "")
                 description = action_data.get("description", "")
+                desc_lower = description.lower() if description else ""
                 value = action_data.get("value", "")
                 
                 # Update execution state based on action
                 if action == "navigate":
                     url = action_data.get("url", "")
-                    if "linkedin" in url.lower():
-                        self.execution_state["current_site"] = "linkedin"
-                    elif "twitter" in url.lower() or "x.com" in url.lower():
-                        self.execution_state["current_site"] = "twitter"
-                    elif "facebook" in url.lower():
-                        self.execution_state["current_site"] = "facebook"
-                    elif "google" in url.lower() or "search" in url.lower():
-                        self.execution_state["current_site"] = "search_engine"
-                    elif "wikipedia" in url.lower():
-                        self.execution_state["current_site"] = "wikipedia"
+                    site_match = self._SITE_RE.search(url)
+                    if site_match:
+                        self.execution_state["current_site"] = self._SITE_MAP[site_match.group(1).lower()]
                 
                 # Check if this is a signup flow
-                if "signup" in description.lower() or "create account" in description.lower():
+                if "signup" in desc_lower or "create account" in desc_lower:
                     self.execution_state["is_signup_flow"] = True
                 
                 # Check if this is a search operation
-                if action == "search" or "search" in description.lower():
+                if action == "search" or "search" in desc_lower:
                     self.execution_state["is_search_operation"] = True
                     self.execution_state["search_query"] = value
                 
                 # Track data usage
                 if action == "type" and value:
-                    if action_data.get("is_random_data", False) or "random" in description.lower():
+                    if action_data.get("is_random_data", False) or "random" in desc_lower:
                         self.execution_state["has_generated_data"] = True
                         if field_type:
                             self.generated_data[field_type] = value
-                            print(f"📝 Generated {field_type}: {value[:20]}{'...' if len(value) > 20 else ''}")
+                            self._log(f"📝 Generated {field_type}: {self._trunc(value)}")
                     else:
                         self.execution_state["has_provided_credentials"] = True
                         if field_type in ["email", "password"]:
                             self.used_provided_data[field_type] = value
-                            print(f"📝 Using provided {field_type}: {value[:20]}{'...' if len(value) > 20 else ''}")
+                            self._log(f"📝 Using provided {field_type}: {self._trunc(value)}")
                 
                 try:
                     step_result = None
                     
-                    if action == "navigate":
-                        step_result = self._execute_navigate(self.page, action_data)
-                    elif action == "search":
-                        step_result = self._execute_search(self.page, action_data)
-                    elif action == "type":
-                        step_result = self._execute_type(self.page, action_data, field_type)
-                    elif action == "select":
-                        step_result = self._execute_select(self.page, action_data, field_type)
-                    elif action == "click":
-                        step_result = self._execute_click(self.page, action_data)
-                    elif action == "wait":
-                        seconds = action_data.get("seconds", 2)
-                        time.sleep(seconds)
-                        step_result = {"action": "wait", "status": "Passed", "details": f"Waited {seconds} seconds"}
-                    elif action == "validate_page":
-                        # Pass execution_state to validation - FIX: Pass as dictionary, not as object attribute
-                        step_result = self._execute_validate_page(self.page, action_data, self.execution_state)
-                    elif action == "info":
-                        message = action_data.get("message", "Information")
-                        print(f"ℹ️ {message}")
-                        step_result = {"action": "info", "status": "Passed", "details": message}
-                    elif action == "generate_data":
-                        details = action_data.get("details", "Generated random data")
-                        step_result = {"action": "generate_data", "status": "Passed", "details": details}
+                    handler = self._handlers.get(action)
+                    if handler:
+                        step_result = handler(self.page, action_data)
                     else:
                         step_result = {"action": action, "status": "Failed", "details": f"Unknown action: {action}"}
                     
@@ -451,22 +838,29 @@ class UniversalExecutor:
                     
                     # If this is a validation step and we have result content, add it to step result
                     if action == "validate_page" and self.execution_state.get("result_page_content"):
-                        step_result["result_content"] = self.execution_state["result_page_content"][:500] + "..." if len(self.execution_state["result_page_content"]) > 500 else self.execution_state["result_page_content"]
+                        step_result["result_content"] = self._result_summary()
                     
                     # Capture screenshot for this step (especially for failures)
                     screenshot_path = None
                     if self.screenshot_capture and self.page:
                         step_description = f"Step {step_number}: {description or action}"
-                        is_failure = step_result.get("status", "").lower() == "failed"
+                        is_failure = step_result.get("status") == STATUS_FAILED
                         
                         try:
-                            # Capture screenshot with analysis
-                            screenshot_info = self.screenshot_capture.capture_with_analysis(
-                                self.page, 
-                                self.current_report_id, 
-                                step_description,
-                                is_final_result=False
-                            )
+                            # Only failed steps need page analysis; passing steps just get the image
+                            if is_failure:
+                                screenshot_info = self.screenshot_capture.capture_with_analysis(
+                                    self.page, 
+                                    self.current_report_id, 
+                                    step_description,
+                                    is_final_result=False
+                                )
+                            else:
+                                screenshot_info = self.screenshot_capture.capture_only(
+                                    self.page,
+                                    self.current_report_id,
+                                    step_description
+                                )
                             
                             if screenshot_info:
                                 screenshot_path = screenshot_info.get("screenshot_path")
@@ -485,28 +879,28 @@ class UniversalExecutor:
                                         "screenshot_info": screenshot_info,
                                         "error": step_result.get("details", "")
                                     }
-                                    print(f"📸 Captured failed step screenshot: {screenshot_path}")
+                                    self._log(f"📸 Captured failed step screenshot: {screenshot_path}")
                                 else:
-                                    print(f"📸 Captured step screenshot: {screenshot_path}")
+                                    self._log(f"📸 Captured step screenshot: {screenshot_path}")
                         except Exception as e:
-                            print(f"[Executor] Failed to capture screenshot: {e}")
+                            self._log(f"[Executor] Failed to capture screenshot: {e}")
                     
                     # Store execution step for summary
-                    self.execution_steps.append({
-                        "step": step_number,
-                        "action": action,
-                        "status": step_result.get("status", "unknown"),
-                        "description": description,
-                        "details": step_result.get("details", ""),
-                        "screenshot": screenshot_path,
-                        "duration": step_result.get("duration", 0),
-                        "result_content": step_result.get("result_content") if action == "validate_page" else None
-                    })
+                    self.execution_steps.append(StepRecord(
+                        step=step_number,
+                        action=action,
+                        status=step_result.get("status", "unknown"),
+                        description=description,
+                        details=step_result.get("details", ""),
+                        screenshot=screenshot_path,
+                        duration=step_result.get("duration", 0),
+                        result_content=step_result.get("result_content") if action == "validate_page" else None
+                    ))
                     
                     results.append(step_result)
                     
                     # If action failed, stop execution (except for validation/wait/info)
-                    if step_result["status"] == "Failed" and action not in ["wait", "validate_page", "info", "generate_data"]:
+                    if step_result["status"] == STATUS_FAILED and action not in NON_BLOCKING_ACTIONS:
                         results.append({
                             "action": "execution_stopped",
                             "status": "Failed",
@@ -515,8 +909,9 @@ class UniversalExecutor:
                         break
                 
                 except Exception as e:
-                    error_trace = traceback.format_exc()
-                    print(f"❌ Error in step {step_number} ({action}): {str(e)}")
+                    self._log(f"❌ Error in step {step_number} ({action}): {str(e)}")
+                    if EXECUTOR_DEBUG:
+                        traceback.print_exc()
                     
                     step_result = {
                         "step": step_number,
@@ -549,7 +944,7 @@ class UniversalExecutor:
                                     "error": str(e)
                                 }
                         except Exception as screenshot_error:
-                            print(f"[Executor] Failed to capture error screenshot: {screenshot_error}")
+                            self._log(f"[Executor] Failed to capture error screenshot: {screenshot_error}")
                     
                     results.append(step_result)
                     break
@@ -557,25 +952,32 @@ class UniversalExecutor:
             # Capture final result page screenshot (regardless of success/failure)
             if self.page and self.screenshot_capture:
                 try:
-                    print(f"📸 Capturing final result page...")
+                    self._log(f"📸 Capturing final result page...")
                     
                     # Extract page content for result summary
                     page_content = self._extract_page_content(self.page)
                     if page_content:
                         self.execution_state["result_page_content"] = page_content
-                        self.execution_state["result_summary"] = page_content[:500] + "..." if len(page_content) > 500 else page_content
                     
                     # Capture final page with analysis
                     final_screenshot_info = self.screenshot_capture.capture_with_analysis(
                         self.page,
                         self.current_report_id,
                         "Final Result Page",
-                        is_final_result=True
+                        is_final_result=True,
+                        page_text=page_content
                     )
                     
                     if final_screenshot_info:
                         self.final_result_page = final_screenshot_info
                         
+                        # Settle the Gemini summary now, so the step record carries it
+                        basic_summary = final_screenshot_info.get("result_summary")
+                        resolved_summary = self.screenshot_capture.resolve_summary(
+                            final_screenshot_info, timeout=self.GEMINI_SUMMARY_TIMEOUT
+                        )
+                        gemini_summary = resolved_summary if resolved_summary != basic_summary else None
+                        
                         # Add result page capture as a step
                         result_page_step = {
                             "step": len(results) + 1,
@@ -585,31 +987,39 @@ class UniversalExecutor:
                             "details": "Result page screenshot captured with analysis",
                             "screenshot": final_screenshot_info.get("screenshot_path"),
                             "page_analysis": final_screenshot_info.get("analysis", {}),
-                            "result_summary": self.execution_state.get("result_summary", "Result page captured"),
+                            "result_summary": gemini_summary or self._result_summary() or "Result page captured",
                             "result_content": self.execution_state.get("result_page_content", "Result page captured"),
                             "full_content": final_screenshot_info.get("full_content"),
                             "is_result_page": True
                         }
                         
                         results.append(result_page_step)
-                        self.execution_steps.append(result_page_step)
+                        self.execution_steps.append(StepRecord(
+                            step=result_page_step["step"],
+                            action="result_page_capture",
+                            status="Passed",
+                            description=result_page_step["description"],
+                            details=result_page_step["details"],
+                            screenshot=result_page_step["screenshot"],
+                            result_content=result_page_step["result_content"]
+                        ))
                         
-                        print(f"✅ Captured final result page: {final_screenshot_info.get('screenshot_path')}")
+                        self._log(f"✅ Captured final result page: {final_screenshot_info.get('screenshot_path')}")
                         
                         # Extract result summary
-                        result_summary = self.execution_state.get("result_summary")
+                        result_summary = self._result_summary()
                         if result_summary:
-                            print(f"📋 Result Summary: {result_summary[:100]}{'...' if len(result_summary) > 100 else ''}")
+                            self._log(f"📋 Result Summary: {self._trunc(result_summary, 100)}")
                 except Exception as e:
-                    print(f"❌ Failed to capture final result page: {e}")
+                    self._log(f"❌ Failed to capture final result page: {e}")
             
             # Add summary of data usage
             if self.generated_data or self.used_provided_data:
                 summary = []
                 if self.used_provided_data:
-                    summary.append(f"Provided: {', '.join([f'{k}={v[:15]}...' if len(v) > 15 else f'{k}={v}' for k, v in self.used_provided_data.items()])}")
+                    summary.append(f"Provided: {', '.join(f'{k}={self._trunc(v, 15)}' for k, v in self.used_provided_data.items())}")
                 if self.generated_data:
-                    summary.append(f"Generated: {', '.join([f'{k}={v[:15]}...' if len(v) > 15 else f'{k}={v}' for k, v in self.generated_data.items()])}")
+                    summary.append(f"Generated: {', '.join(f'{k}={self._trunc(v, 15)}' for k, v in self.generated_data.items())}")
                 
                 results.append({
                     "action": "data_summary",
@@ -617,10 +1027,15 @@ class UniversalExecutor:
                     "details": " | ".join(summary),
                     "description": "Data usage summary"
                 })
-            
-            # Close browser
+        
+        finally:
+            self._flush_step_log()
+            # Close this run's page and context; the browser stays up for the next run
             self._cleanup()
         
+        # Summary is derived from the stored page content once, after the last writer
+        self.execution_state["result_summary"] = self._result_summary()
+        
         # Generate execution summary
         execution_summary = self._generate_execution_summary(results)
         print(f"\n📊 Execution Summary:")
@@ -630,127 +1045,84 @@ class UniversalExecutor:
         print(f"   Success Rate: {execution_summary['success_rate']:.1f}%")
         print(f"   Screenshots: {len([r for r in results if r.get('screenshot')])}")
         if self.execution_state.get("result_summary"):
-            print(f"   Result Summary: {self.execution_state['result_summary'][:100]}...")
+            print(f"   Result Summary: {self._trunc(self.execution_state['result_summary'], 100)}")
         
         return results
     
+    def _result_summary(self, limit=500):
+        """Leading part of the stored result page content, computed on demand"""
+        content = self.execution_state.get("result_page_content")
+        return self._trunc(content, limit) if content else content
+    
+    @staticmethod
+    def _trunc(text, limit=20):
+        """Cut text to limit characters, marking the cut with '...'"""
+        return text if len(text) <= limit else f"{text[:limit]}..."
+    
+    def _log(self, *args):
+        """print() into the step log; it reaches stdout at the end of the step"""
+        print(*args, file=self._step_log)
+    
+    def _flush_step_log(self):
+        """Write the buffered step log to stdout in a single write"""
+        step_log = self._step_log
+        if step_log.tell():
+            sys.stdout.write(step_log.getvalue())
+            sys.stdout.flush()
+            step_log.seek(0)
+            step_log.truncate(0)
+    
+    def _logged_steps(self, actions):
+        """Yield actions, flushing each step's buffered console output after it"""
+        try:
+            for action_data in actions:
+                yield action_data
+                self._flush_step_log()
+        finally:
+            # Also runs when the loop breaks or raises mid-step
+            self._flush_step_log()
+    
+    def _locator(self, page, selector):
+        """Return the cached first-match Locator for selector on the current document"""
+        loc = self._locator_cache.get(selector)
+        if loc is None:
+            loc = self._locator_cache[selector] = page.locator(selector).first
+        return loc
+    
+    def _pattern_hits(self, category, text_lower):
+        """Yield the matched text for each pattern of a validation category found in text_lower"""
+        found_literals = self._literal_hits(text_lower)
+        for regex, literal in self._compiled_patterns[category]:
+            if regex is None:
+                if literal in found_literals:
+                    yield literal
+            else:
+                match = regex.search(text_lower)
+                if match:
+                    yield match.group(0)
+    
+    def _literal_hits(self, text_lower):
+        """Set of validation phrases present in text_lower; the last scan is reused across categories"""
+        scanned_text, found = self._literal_scan
+        if scanned_text is not text_lower:
+            found = self._scan_literals(text_lower)
+            self._literal_scan = (text_lower, found)
+        return found
+    
+    def _route_request(self, route):
+        """Abort heavy assets that validation and typing/clicking never need"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
     def _extract_page_content(self, page):
         """Extract meaningful content from the current page"""
         try:
-            content_parts = []
-            
-            # Get page title
-            try:
-                title = page.title()
-                if title and len(title.strip()) > 0:
-                    content_parts.append(f"Page Title: {title}")
-            except:
-                pass
-            
-            # Get main content using common selectors
-            content_selectors = [
-                "main", "article", "#main", ".main-content", ".content",
-                "#search", ".search-results", "#results", ".results",
-                "#bodyContent", ".mw-parser-output", "#mw-content-text",
-                ".g", ".srg", "#res", "#rcnt",
-                "div[role='main']", ".post-content", ".entry-content"
-            ]
-            
-            for selector in content_selectors:
-                try:
-                    elements = page.locator(selector).all()
-                    for elem in elements[:2]:  # Limit to first 2 elements
-                        if elem.is_visible():
-                            text = elem.inner_text(timeout=1000)
-                            if text and len(text.strip()) > 50:
-                                # Clean text
-                                text = re.sub(r'\s+', ' ', text)
-                                content_parts.append(text.strip())
-                except:
-                    continue
-            
-            # If no content with selectors, get paragraphs
-            if not content_parts:
-                try:
-                    paragraphs = page.locator("p").all()
-                    for p in paragraphs[:5]:
-                        if p.is_visible():
-                            text = p.inner_text(timeout=1000)
-                            if text and len(text.strip()) > 30:
-                                text = re.sub(r'\s+', ' ', text)
-                                content_parts.append(text.strip())
-                except:
-                    pass
-            
-            # For Google search results, extract specific content
-            if "google.com" in page.url.lower():
-                try:
-                    # Get search result snippets
-                    snippets = page.locator(".VwiC3b, .MUxGbd, .lyLwlc").all()
-                    for snippet in snippets[:3]:
-                        if snippet.is_visible():
-                            text = snippet.inner_text()
-                            if text:
-                                content_parts.append(f"Search result: {text[:200]}...")
-                except:
-                    pass
-            
-            # For Wikipedia, extract article content
-            if "wikipedia.org" in page.url.lower():
-                try:
-                    # Get article title
-                    title_elem = page.locator("#firstHeading").first
-                    if title_elem.is_visible():
-                        title = title_elem.inner_text()
-                        content_parts.append(f"Wikipedia Article: {title}")
-                    
-                    # Get first few paragraphs
-                    paragraphs = page.locator(".mw-parser-output p").all()
-                    for p in paragraphs[:3]:
-                        if p.is_visible():
-                            text = p.inner_text()
-                            if text:
-                                text = re.sub(r'\s+', ' ', text)
-                                if len(text) > 200:
-                                    text = text[:200] + "..."
-                                content_parts.append(text)
-                except:
-                    pass
-            
-            # For Amazon product pages
-            if "amazon.com" in page.url.lower():
-                try:
-                    # Get product title
-                    title_elem = page.locator("#productTitle, .a-size-large").first
-                    if title_elem.is_visible():
-                        title = title_elem.inner_text()
-                        if title:
-                            content_parts.append(f"Product: {title.strip()}")
-                    
-                    # Get product description
-                    desc_elem = page.locator("#productDescription, .a-spacing-small").first
-                    if desc_elem.is_visible():
-                        desc = desc_elem.inner_text()
-                        if desc:
-                            content_parts.append(desc.strip()[:200] + "...")
-                except:
-                    pass
-            
-            if content_parts:
-                return "\n\n".join(content_parts[:3])
-            else:
-                # Fallback: get body text
-                try:
-                    body_text = page.inner_text("body")
-                    body_text = re.sub(r'\s+', ' ', body_text)
-                    if len(body_text) > 500:
-                        body_text = body_text[:500] + "..."
-                    return body_text
-                except:
-                    return "Page loaded successfully"
-                    
+            # Title, content selectors and the site-specific parts in one round-trip
+            return page.evaluate(_PAGE_CONTENT_JS)
         except Exception as e:
-            print(f"Error extracting page content: {e}")
+            self._log(f"Error extracting page content: {e}")
             return "Could not extract page content"
     
     def _extract_wikipedia_content(self, page):
@@ -760,25 +1132,17 @@ class UniversalExecutor:
             
             # Get article title
             try:
-                title_elem = page.locator("#firstHeading").first
-                if title_elem.is_visible():
-                    title = title_elem.inner_text()
-                    if title:
-                        content_parts.append(f"Article: {title}")
+                titles = page.locator("#firstHeading").evaluate_all(_VISIBLE_TEXTS_OF_JS, [1, 0])
+                if titles:
+                    content_parts.append(f"Article: {titles[0]}")
             except:
                 pass
             
-            # Get article content paragraphs
+            # Get article content paragraphs (first 5, one round-trip)
             try:
-                paragraphs = page.locator(".mw-parser-output p").all()
-                for p in paragraphs[:5]:  # First 5 paragraphs
-                    if p.is_visible():
-                        text = p.inner_text()
-                        if text and len(text.strip()) > 30:
-                            text = re.sub(r'\s+', ' ', text)
-                            if len(text) > 200:
-                                text = text[:200] + "..."
-                            content_parts.append(text.strip())
+                paragraphs = page.locator(".mw-parser-output p").evaluate_all(_VISIBLE_TEXTS_OF_JS, [5, 30])
+                for text in paragraphs:
+                    content_parts.append(self._trunc(text, 200))
             except:
                 pass
             
@@ -788,11 +1152,77 @@ class UniversalExecutor:
                 return "Wikipedia article loaded successfully"
                 
         except Exception as e:
-            print(f"Error extracting Wikipedia content: {e}")
+            self._log(f"Error extracting Wikipedia content: {e}")
             return f"Wikipedia content: {str(e)}"
     
+    @staticmethod
+    def _launch_browser(headless):
+        """Start Playwright and launch Chromium; returns (playwright, browser)"""
+        # Imported here so loading this module (e.g. to read its selector tables)
+        # does not pull in the Playwright driver bindings
+        from playwright.sync_api import sync_playwright
+        
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(
+            headless=headless,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--start-maximized',
+                '--disable-web-security',
+                '--disable-features=IsolateOrigins,site-per-process',
+                '--no-sandbox'
+            ]
+        )
+        return playwright, browser
+    
+    @classmethod
+    def _get_shared_browser(cls, headless):
+        """Process-wide browser for share_browser executors, launched on first use"""
+        shared = UniversalExecutor._shared
+        browser = shared.get("browser")
+        if browser and browser.is_connected() and shared.get("headless") == headless:
+            return browser
+        
+        cls.shutdown_browser()
+        shared["playwright"], shared["browser"] = cls._launch_browser(headless)
+        shared["headless"] = headless
+        if not shared.get("atexit_registered"):
+            atexit.register(cls.shutdown_browser)
+            shared["atexit_registered"] = True
+        return shared["browser"]
+    
+    @classmethod
+    def shutdown_browser(cls):
+        """Close the shared browser (registered with atexit)"""
+        shared = UniversalExecutor._shared
+        try:
+            if shared.get("browser"):
+                shared["browser"].close()
+            if shared.get("playwright"):
+                shared["playwright"].stop()
+        except Exception as e:
+            print(f"[Executor] Shared browser shutdown error: {e}")
+        finally:
+            shared["browser"] = None
+            shared["playwright"] = None
+            shared["headless"] = None
+    
+    def _ensure_browser(self, headless):
+        """Launch Playwright and Chromium once; later runs reuse them"""
+        if self.share_browser:
+            self.browser = self._get_shared_browser(headless)
+            return
+        
+        if self.browser and self.browser.is_connected() and self._browser_headless == headless:
+            return
+        
+        self.close()
+        self._playwright, self.browser = self._launch_browser(headless)
+        self._browser_headless = headless
+    
     def _cleanup(self):
-        """Clean up browser resources"""
+        """Clean up the current run's page and context"""
+        self._wikipedia_extract = (None, None, None)
         try:
             if self.page:
                 self.page.close()
@@ -800,17 +1230,44 @@ class UniversalExecutor:
             if self.context:
                 self.context.close()
                 self.context = None
+        except Exception as e:
+            print(f"[Executor] Cleanup error: {e}")
+    
+    def close(self):
+        """Shut down the browser and Playwright; call once the executor is no longer needed"""
+        self._cleanup()
+        if self.screenshot_capture:
+            self.screenshot_capture.close()
+        if self.share_browser:
+            # The shared browser outlives this executor; see shutdown_browser()
+            self.browser = None
+            return
+        try:
             if self.browser:
                 self.browser.close()
-                self.browser = None
+            if self._playwright:
+                self._playwright.stop()
         except Exception as e:
-            print(f"[Executor] Cleanup error: {e}")
+            print(f"[Executor] Close error: {e}")
+        finally:
+            self.browser = None
+            self._playwright = None
+            self._browser_headless = None
     
     def _generate_execution_summary(self, results):
         """Generate execution summary from results"""
-        total_steps = len([r for r in results if r.get("step")])
-        passed_steps = len([r for r in results if r.get("status", "").lower() == "passed"])
-        failed_steps = len([r for r in results if r.get("status", "").lower() == "failed"])
+        # Single pass over results, no intermediate lists
+        total_steps = passed_steps = failed_steps = screenshots = 0
+        for r in results:
+            if r.get("step"):
+                total_steps += 1
+            status = r.get("status")
+            if status == STATUS_PASSED:
+                passed_steps += 1
+            elif status == STATUS_FAILED:
+                failed_steps += 1
+            if r.get("screenshot"):
+                screenshots += 1
         
         success_rate = (passed_steps / total_steps * 100) if total_steps > 0 else 0
         
@@ -819,7 +1276,7 @@ class UniversalExecutor:
             "passed_steps": passed_steps,
             "failed_steps": failed_steps,
             "success_rate": success_rate,
-            "has_screenshots": len([r for r in results if r.get("screenshot")]) > 0,
+            "has_screenshots": screenshots > 0,
             "result_page_captured": self.final_result_page is not None,
             "last_failed_step": self.last_failed_step,
             "result_summary": self.execution_state.get("result_summary")
@@ -832,6 +1289,8 @@ class UniversalExecutor:
         
         screenshots = self.screenshot_capture.get_all_screenshots(self.current_report_id)
         
+        self.screenshot_capture.resolve_summary(self.final_result_page)
+        
         metadata = {
             "result_page": self.final_result_page,
             "last_failed": self.last_failed_step.get("screenshot_info") if self.last_failed_step else None,
@@ -844,20 +1303,46 @@ class UniversalExecutor:
     def get_result_summary(self):
         """Get result page summary"""
         if self.final_result_page:
+            if self.screenshot_capture:
+                self.screenshot_capture.resolve_summary(self.final_result_page)
             return self.final_result_page.get("result_summary", "Result page captured")
         return self.execution_state.get("result_summary")
     
     def _wait_for_stability(self, page, extra_wait=2, check_element=None):
         """Wait for page stability"""
         try:
+            # Network went idle: the page is ready, no fixed sleep needed
             page.wait_for_load_state("networkidle", timeout=20000)
-            time.sleep(extra_wait)
             
             if check_element:
                 page.wait_for_selector(check_element, timeout=5000, state="visible")
         except:
             time.sleep(extra_wait)
     
+    def _settle(self, page, timeout=5000):
+        """Wait (briefly) for activity triggered by a click or key press to go idle"""
+        try:
+            page.wait_for_load_state("networkidle", timeout=timeout)
+        except:
+            pass
+    
+    def _execute_wait(self, page, action_data):
+        """Pause for the requested number of seconds"""
+        seconds = action_data.get("seconds", 2)
+        time.sleep(seconds)
+        return {"action": "wait", "status": "Passed", "details": f"Waited {seconds} seconds"}
+    
+    def _execute_info(self, page, action_data):
+        """Log an informational step"""
+        message = action_data.get("message", "Information")
+        self._log(f"ℹ️ {message}")
+        return {"action": "info", "status": "Passed", "details": message}
+    
+    def _execute_generate_data(self, page, action_data):
+        """Record a data generation step"""
+        details = action_data.get("details", "Generated random data")
+        return {"action": "generate_data", "status": "Passed", "details": details}
+    
     def _execute_navigate(self, page, action_data):
         """Navigate to URL"""
         url = action_data.get("url", "")
@@ -866,6 +1351,7 @@ class UniversalExecutor:
         
         try:
             page.goto(url, wait_until="domcontentloaded", timeout=40000)
+            self._locator_cache.clear()
             self._wait_for_stability(page, 3)
             
             # Handle cookie banners
@@ -877,25 +1363,11 @@ class UniversalExecutor:
     
     def _handle_cookie_banner(self, page):
         """Handle cookie consent banners"""
-        cookie_selectors = [
-            "button:has-text('Accept all cookies')",
-            "button:has-text('Accept cookies')",
-            "button:has-text('I accept')", 
-            "button:has-text('Agree')",
-            "button:has-text('Accept all')",
-            ".accept-cookies",
-            "#accept-cookies",
-            "button[aria-label*='cookie' i]",
-            "button[aria-label*='accept' i]",
-            "#sp-cc-accept",  # Amazon cookie banner
-        ]
-        
-        for selector in cookie_selectors:
+        # Two unions instead of one 3 s wait per selector when there is no banner
+        for selector in (COOKIE_TEXT_UNION, COOKIE_CSS_UNION):
             try:
-                page.wait_for_selector(selector, timeout=3000)
-                page.click(selector)
-                time.sleep(1)
-                print(f"✅ Clicked cookie banner: {selector}")
+                page.locator(selector).first.click(timeout=3000)
+                self._log(f"✅ Clicked cookie banner: {selector}")
                 break
             except:
                 continue
@@ -916,70 +1388,82 @@ class UniversalExecutor:
             for sel in selectors:
                 try:
                     result = self._perform_search(page, sel, query)
-                    if result["status"] == "Passed":
+                    if result["status"] == STATUS_PASSED:
                         # After search, extract page content for result analysis
                         content = self._extract_page_content(page)
                         if content:
                             self.execution_state["result_page_content"] = content
-                            self.execution_state["result_summary"] = content[:500] + "..." if len(content) > 500 else content
                         return result
                 except:
                     continue
         
-        # Try common search selectors
-        for sel in self.field_selectors["search"]:
+        # Highest-priority visible search box (one union wait), then each selector as a fallback
+        candidates = self.field_selectors["search"]
+        best = self._first_visible_selector(page, candidates, self.field_selectors_joined["search"])
+        for sel, timeout in ([(best, 2000)] if best else []) + [(sel, 2000) for sel in candidates]:
             try:
-                result = self._perform_search(page, sel, query)
-                if result["status"] == "Passed":
+                result = self._perform_search(page, sel, query, timeout=timeout)
+                if result["status"] == STATUS_PASSED:
                     # After search, extract page content for result analysis
                     content = self._extract_page_content(page)
                     if content:
                         self.execution_state["result_page_content"] = content
-                        self.execution_state["result_summary"] = content[:500] + "..." if len(content) > 500 else content
                     return result
             except:
                 continue
         
         return {"action": "search", "status": "Failed", "details": "Search box not found"}
     
-    def _perform_search(self, page, selector: str, query: str):
+    def _first_visible_selector(self, page, selectors, union, timeout=5000):
+        """Wait on the union until any candidate is visible, then walk the priority
+        list; returns the first selector (":visible") with a match, or None"""
+        try:
+            page.locator(union).first.wait_for(state="visible", timeout=timeout)
+        except Exception:
+            return None
+        for sel in selectors:
+            visible = f"{sel}:visible"
+            try:
+                if page.locator(visible).count():
+                    return visible
+            except Exception:
+                continue
+        return None
+    
+    def _perform_search(self, page, selector: str, query: str, timeout=10000):
         """Perform search with given selector"""
         try:
-            page.wait_for_selector(selector, state="visible", timeout=10000)
+            page.wait_for_selector(selector, state="visible", timeout=timeout)
             
             elem = page.locator(selector).first
-            elem.scroll_into_view_if_needed()
-            time.sleep(0.5)
-            
-            # Clear and type
-            elem.click()
-            time.sleep(0.3)
-            elem.fill("")
-            time.sleep(0.2)
-            elem.fill(query)
-            time.sleep(0.5)
+            self._fill_field(elem, query)
             
-            # Try pressing Enter
-            elem.press("Enter")
-            time.sleep(2)
-            
-            # Also try to find and click search button
+            # Press Enter and return as soon as the results page starts loading
+            navigated = True
             try:
-                page.wait_for_timeout(1000)
-                
-                # Special handling for Wikipedia search button
-                if "wikipedia.org" in page.url:
-                    search_button = page.locator("#searchButton, button[type='submit'], input[type='submit'][value*='Search' i]").first
-                    if search_button.is_visible():
-                        search_button.click()
-                        time.sleep(1)
-                else:
-                    search_buttons = page.locator("button:has-text('Search'), #searchButton, .search-button, input[type='submit'][value*='Search' i]")
-                    if search_buttons.count() > 0:
-                        search_buttons.first.click()
-                        time.sleep(1)
-            except:
-                pass
+                with page.expect_navigation(wait_until="domcontentloaded", timeout=5000):
+                    elem.press("Enter")
+            except Exception as e:
+                if "Timeout" not in type(e).__name__:
+                    raise
+                # No navigation (in-page/AJAX search): wait for its requests instead
+                navigated = False
+                self._settle(page)
+            
+            # Enter did not submit: also try to find and click search button
+            if not navigated:
+                try:
+                    # Special handling for Wikipedia search button
+                    if "wikipedia.org" in page.url:
+                        search_button = page.locator("#searchButton, button[type='submit'], input[type='submit'][value*='Search' i]").first
+                        if search_button.is_visible():
+                            search_button.click()
+                    else:
+                        search_buttons = page.locator("button:has-text('Search'), #searchButton, .search-button, input[type='submit'][value*='Search' i]")
+                        if search_buttons.count() > 0:
+                            search_buttons.first.click()
+                except:
+                    pass
             
             # Wait for results
             self._wait_for_stability(page, 2)
@@ -998,19 +1482,18 @@ class UniversalExecutor:
                 else:
                     return {"action": "search", "status": "Passed", "details": f"✅ Searched Wikipedia for: {query}"}
             
-            # For other sites, check if search was successful
-            page_text = page.inner_text("body").lower()
-            
-            # Check for search success indicators
-            search_indicators = [
-                "results", "search", "showing", "did you mean", 
-                "related searches", "no results found", "no matches",
-                query.lower()
-            ]
+            # For other sites, a results URL is enough to call the search completed
+            if "?" in current_url or "search" in current_url or "q=" in current_url:
+                return {"action": "search", "status": "Passed", "details": f"✅ Search completed: {query}"}
             
-            indicator_count = sum(1 for indicator in search_indicators if indicator in page_text)
+            # Otherwise count search success indicators in-page (only the count crosses CDP)
+            search_indicators = [*_SEARCH_INDICATORS, query.lower()]
+            try:
+                indicator_count = page.evaluate(_COUNT_TEXT_INDICATORS_JS, search_indicators)
+            except:
+                indicator_count = 0
             
-            if indicator_count > 0 or "?" in current_url or "search" in current_url or "q=" in current_url:
+            if indicator_count > 0:
                 return {"action": "search", "status": "Passed", "details": f"✅ Search completed: {query}"}
             else:
                 return {"action": "search", "status": "Passed", "details": f"✅ Search executed: {query}"}
@@ -1030,13 +1513,12 @@ class UniversalExecutor:
         
         # Special handling for LinkedIn email field
         if field_type == "email" and "linkedin" in page.url:
-            print(f"📧 LinkedIn email detection: using email-address field for {value[:10]}...")
+            self._log(f"📧 LinkedIn email detection: using email-address field for {self._trunc(value, 10)}")
             # Prioritize LinkedIn-specific selectors
-            linkedin_selectors = ["input[name='email-address']", "input[id='email-address']"]
-            for sel in linkedin_selectors:
+            for sel in _LINKEDIN_EMAIL_SELECTORS:
                 try:
                     result = self._perform_type(page, sel, value, field_type)
-                    if result["status"] == "Passed":
+                    if result["status"] == STATUS_PASSED:
                         return result
                 except:
                     continue
@@ -1047,59 +1529,44 @@ class UniversalExecutor:
             for sel in selectors_list:
                 try:
                     result = self._perform_type(page, sel, value, field_type)
-                    if result["status"] == "Passed":
+                    if result["status"] == STATUS_PASSED:
                         return result
                 except:
                     continue
         
-        # Use field_type based selectors
-        if field_type and field_type in self.field_selectors:
-            for sel in self.field_selectors[field_type]:
+        # Use field_type based selectors: the highest-priority visible one (one union
+        # wait), then each selector as a fallback
+        if field_type and field_type in self.field_selectors_joined:
+            candidates = self.field_selectors[field_type]
+            best = self._first_visible_selector(page, candidates, self.field_selectors_joined[field_type])
+            for sel, timeout in ([(best, 2000)] if best else []) + [(sel, 2000) for sel in candidates]:
                 try:
-                    result = self._perform_type(page, sel, value, field_type)
-                    if result["status"] == "Passed":
+                    result = self._perform_type(page, sel, value, field_type, timeout=timeout)
+                    if result["status"] == STATUS_PASSED:
                         return result
                 except:
                     continue
         
-        # Try generic input
+        # Try the first visible, enabled text-like input
         try:
-            page.wait_for_selector("input", state="visible", timeout=5000)
-            inputs = page.locator("input").all()
-            for input_elem in inputs[:5]:
-                try:
-                    input_elem.fill(value)
-                    time.sleep(0.5)
-                    return {"action": "type", "status": "Passed", "details": f"Typed {field_type}: {value}"}
-                except:
-                    continue
+            elem = page.locator(GENERIC_INPUT_SELECTOR).first
+            elem.wait_for(state="visible", timeout=5000)
+            elem.fill(value, timeout=3000)
+            return {"action": "type", "status": "Passed", "details": f"Typed {field_type}: {value}"}
         except:
             pass
         
         return {"action": "type", "status": "Failed", "details": f"Input field for {field_type} not found"}
     
-    def _perform_type(self, page, selector: str, value: str, field_type: str):
+    def _perform_type(self, page, selector: str, value: str, field_type: str, timeout=15000):
         """Perform typing with given selector"""
         try:
-            page.wait_for_selector(selector, state="visible", timeout=15000)
-            
-            elem = page.locator(selector).first
-            elem.scroll_into_view_if_needed()
-            time.sleep(0.5)
+            elem = self._locator(page, selector)
+            elem.wait_for(state="visible", timeout=timeout)
             
-            # Clear and type
-            elem.click()
-            time.sleep(0.3)
-            
-            try:
-                elem.fill("")
-            except:
-                elem.press("Control+A")
-                elem.press("Backspace")
-            
-            time.sleep(0.2)
-            elem.fill(value)
-            time.sleep(0.5)
+            if not self._fill_and_verify(elem, value):
+                # Page rejected the direct value set: fill through Playwright
+                self._fill_field(elem, value)
             
             # Mask password value in logs
             display_value = value
@@ -1110,6 +1577,32 @@ class UniversalExecutor:
         except Exception as e:
             raise Exception(f"Type failed with {selector}: {str(e)}")
     
+    def _fill_field(self, elem, value):
+        """Fill an input in one action (fill focuses and replaces the content itself)"""
+        try:
+            elem.fill(value, timeout=5000)
+        except Exception:
+            # Only rich-text (contenteditable) widgets get the select-all-and-type
+            # fallback; anything else (checkbox, button) is the wrong target, so the
+            # caller moves on to its next selector
+            try:
+                editable = elem.evaluate("e => e.isContentEditable")
+            except Exception:
+                editable = False
+            if not editable:
+                raise
+            elem.click()
+            elem.press("Control+A")
+            elem.press("Backspace")
+            elem.type(value)
+    
+    def _fill_and_verify(self, elem, value):
+        """Set an input's value in a single page.evaluate; False if it did not stick"""
+        try:
+            return bool(elem.evaluate(_FILL_AND_VERIFY_JS, value))
+        except Exception:
+            return False
+    
     def _execute_select(self, page, action_data, field_type=""):
         """Select from dropdown"""
         selector = action_data.get("selector", "")
@@ -1129,20 +1622,17 @@ class UniversalExecutor:
             # Try by value first
             try:
                 page.select_option(selector, value=value_str)
-                time.sleep(0.5)
                 return {"action": "select", "status": "Passed", "details": f"Selected {field_type}: {value_str}"}
             except:
                 # Try by label/text
                 try:
                     page.select_option(selector, label=value_str)
-                    time.sleep(0.5)
                     return {"action": "select", "status": "Passed", "details": f"Selected {field_type}: {value_str}"}
                 except:
                     # Try by index if numeric
                     if value_str.isdigit():
                         try:
                             page.select_option(selector, index=int(value_str))
-                            time.sleep(0.5)
                             return {"action": "select", "status": "Passed", "details": f"Selected {field_type}: {value_str}"}
                         except:
                             pass
@@ -1164,23 +1654,16 @@ class UniversalExecutor:
         # Text-based strategies
         if text:
             text_lower = text.lower()
-            strategies.extend([
-                f"button:has-text('{text}')",
-                f"a:has-text('{text}')",
-                f"div[role='button']:has-text('{text}')",
-                f"span:has-text('{text}')",
-                f"input[value='{text}']",
-            ])
+            strategies.extend(template.format(text) for template in _CLICK_TEXT_TEMPLATES)
             
-            # Add type-specific selectors
+            # Add type-specific selectors, in priority order
             if "login" in text_lower or "log in" in text_lower or "sign in" in text_lower:
                 strategies.extend(self.action_selectors["login_button"])
             elif "sign up" in text_lower or "create account" in text_lower or "join" in text_lower or "agree" in text_lower:
                 strategies.extend(self.action_selectors["signup_button"])
                 # LinkedIn-specific join button
                 if "linkedin" in page.url:
-                    strategies.append("button:has-text('Agree & Join')")
-                    strategies.append("button:has-text('Join now')")
+                    strategies.extend(_LINKEDIN_JOIN_SELECTORS)
             elif "next" in text_lower:
                 strategies.extend(self.action_selectors["next_button"])
             elif "add to cart" in text_lower:
@@ -1193,21 +1676,31 @@ class UniversalExecutor:
             selectors_list = [s.strip() for s in selector.split(',')]
             strategies = selectors_list + strategies
         
+        # Drop repeats, keeping priority order
+        strategies = list(dict.fromkeys(strategies))
+        
+        # One wait for any candidate at all (a union of the raw selectors, used only
+        # as a probe); when none shows up, skip the per-strategy waits
+        if strategies:
+            try:
+                page.locator(_join_selectors(strategies)).first.wait_for(state="visible", timeout=5000)
+            except Exception as e:
+                if "Timeout" in type(e).__name__:
+                    strategies = []
+        
         # Try each strategy
         for strategy in strategies:
             try:
-                page.wait_for_selector(strategy, state="visible", timeout=10000)
-                
-                elem = page.locator(strategy).first
+                elem = self._locator(page, strategy)
+                elem.wait_for(state="visible", timeout=2000)
                 elem.scroll_into_view_if_needed()
-                time.sleep(0.5)
                 
                 try:
                     elem.click()
                 except:
                     page.evaluate("(elem) => elem.click()", elem.element_handle())
                 
-                time.sleep(2)
+                self._settle(page)
                 
                 return {"action": "click", "status": "Passed", "details": f"Clicked: {text or strategy}"}
             except:
@@ -1217,13 +1710,81 @@ class UniversalExecutor:
         if text:
             try:
                 page.click(f"text={text}", timeout=3000)
-                time.sleep(2)
+                self._settle(page)
                 return {"action": "click", "status": "Passed", "details": f"Clicked text: {text}"}
             except:
                 pass
         
         return {"action": "click", "status": "Failed", "details": f"Element not found: {text or selector}"}
     
+    def _validate_linkedin_signup(self, page, full_content, execution_state, result_preview):
+        """LinkedIn signup check: passed result dict, or None to fall through to the generic checks"""
+        if not execution_state.get("is_signup_flow", False):
+            return None
+        
+        self._log("🔍 Enhanced LinkedIn signup validation")
+        
+        # The page's literals are already scanned, so counting every hit is set lookups
+        page_literals = self._literal_hits(full_content)
+        found_indicators = [indicator for indicator in _LINKEDIN_SIGNUP_INDICATORS if indicator in page_literals]
+        linkedin_count = len(found_indicators)
+        
+        if linkedin_count >= 1:
+            # Add data usage information
+            details = f"✅ LinkedIn signup successful! ({linkedin_count} indicators found)"
+            
+            # Add data source information
+            if execution_state.get("has_provided_credentials", False):
+                if "email" in self.used_provided_data:
+                    details += f" | Used provided email: {self._trunc(self.used_provided_data['email'], 15)}"
+                if "password" in self.used_provided_data:
+                    details += " | Used provided password"
+            
+            if execution_state.get("has_generated_data", False):
+                generated_fields = list(self.generated_data.keys())
+                if generated_fields:
+                    details += f" | Generated: {', '.join(generated_fields)}"
+            
+            return {
+                "action": "validate_page",
+                "status": "Passed",
+                "details": details,
+                "indicators_found": found_indicators[:3],
+                "result_content": result_preview
+            }
+        return None
+    
+    def _cached_wikipedia_content(self, page):
+        """Wikipedia article content, reused while the same page is still on the same URL"""
+        cached_page, cached_url, content = self._wikipedia_extract
+        url = page.url
+        if cached_page is not page or cached_url != url:
+            content = self._extract_wikipedia_content(page)
+            self._wikipedia_extract = (page, url, content)
+        return content
+    
+    def _validate_wikipedia(self, page, full_content, execution_state, result_preview):
+        """Wikipedia page check: passed result dict, or None to fall through to the generic checks"""
+        # The shared page scan gives both the count and the reported indicators
+        page_literals = self._literal_hits(full_content)
+        wikipedia_found = [indicator for indicator in _WIKIPEDIA_INDICATORS if indicator in page_literals]
+        wikipedia_count = len(wikipedia_found)
+        if wikipedia_count >= 2:
+            # Extract Wikipedia article content (once per page and URL)
+            article_content = self._cached_wikipedia_content(page)
+            if article_content:
+                execution_state["result_page_content"] = article_content
+                result_preview = article_content[:500]
+            
+            return {
+                "action": "validate_page",
+                "status": "Passed",
+                "details": f"✅ Wikipedia page loaded successfully ({wikipedia_count} indicators found)",
+                "indicators_found": wikipedia_found[:3],
+                "result_content": result_preview
+            }
+        return None
+    
     def _execute_validate_page(self, page, action_data, execution_state=None):
         """SMART page validation with enhanced LinkedIn support and content extraction"""
         validation_type = action_data.get("type", "generic")
@@ -1237,10 +1798,8 @@ class UniversalExecutor:
         try:
             self._wait_for_stability(page, 3)
             
-            # Get page content
-            content = page.content().lower()
-            page_text = page.inner_text("body").lower()
-            full_content = content + " " + page_text
+            # Lowercased visible text (plus the URL) in one round-trip
+            full_content = page.evaluate(_VALIDATION_TEXT_JS)
             
             # Check URL
             current_url = page.url.lower()
@@ -1252,105 +1811,22 @@ class UniversalExecutor:
                 if result_content:
                     # Store in execution_state for later use
                     execution_state["result_page_content"] = result_content
-                    execution_state["result_summary"] = result_content[:500] + "..." if len(result_content) > 500 else result_content
             
-            # Enhanced LinkedIn validation
-            if "linkedin.com" in current_url and execution_state.get("is_signup_flow", False):
-                print("🔍 Enhanced LinkedIn signup validation")
-                
-                # LinkedIn signup success indicators (enhanced)
-                linkedin_signup_success = [
-                    "check your email",
-                    "verify your account",
-                    "enter the code",
-                    "enter code",
-                    "enter confirmation code",
-                    "we sent a code",
-                    "verification",
-                    "confirm your email",
-                    "check your inbox",
-                    "email sent",
-                    "confirmation code",
-                    "we've sent a code",
-                    "enter the 6-digit code",
-                    "confirm it's you",
-                    "enter the verification code",
-                    "verify it's you",
-                ]
-                
-                linkedin_count = 0
-                found_indicators = []
-                for indicator in linkedin_signup_success:
-                    if indicator in full_content:
-                        linkedin_count += 1
-                        found_indicators.append(indicator)
-                
-                if linkedin_count >= 1:
-                    # Add data usage information
-                    details = f"✅ LinkedIn signup successful! ({linkedin_count} indicators found)"
-                    
-                    # Add data source information
-                    if execution_state.get("has_provided_credentials", False):
-                        if "email" in self.used_provided_data:
-                            details += f" | Used provided email: {self.used_provided_data['email'][:15]}..."
-                        if "password" in self.used_provided_data:
-                            details += " | Used provided password"
-                    
-                    if execution_state.get("has_generated_data", False):
-                        generated_fields = list(self.generated_data.keys())
-                        if generated_fields:
-                            details += f" | Generated: {', '.join(generated_fields)}"
-                    
-                    return {
-                        "action": "validate_page",
-                        "status": "Passed",
-                        "details": details,
-                        "indicators_found": found_indicators[:3],
-                        "result_content": execution_state.get("result_page_content", "")[:500] if execution_state.get("result_page_content") else None
-                    }
+            # Preview of the result content reported by every return below
+            result_page_content = execution_state.get("result_page_content")
+            result_preview = result_page_content[:500] if result_page_content else None
             
-            # Special Wikipedia validation
-            if "wikipedia.org" in current_url:
-                wikipedia_indicators = [
-                    "wikipedia, the free encyclopedia",
-                    "from wikipedia",
-                    "main page",
-                    "contents",
-                    "article",
-                    "talk",
-                    "read",
-                    "edit",
-                    "view history",
-                    "search",
-                    "create account",
-                    "log in",
-                    "/wiki/"
-                ]
-                
-                wikipedia_count = sum(1 for indicator in wikipedia_indicators if indicator in full_content)
-                if wikipedia_count >= 2:
-                    # Extract Wikipedia article content
-                    article_content = self._extract_wikipedia_content(page)
-                    if article_content:
-                        execution_state["result_page_content"] = article_content
-                        execution_state["result_summary"] = article_content[:500] + "..." if len(article_content) > 500 else article_content
-                    
-                    return {
-                        "action": "validate_page",
-                        "status": "Passed",
-                        "details": f"✅ Wikipedia page loaded successfully ({wikipedia_count} indicators found)",
-                        "indicators_found": [ind for ind in wikipedia_indicators if ind in full_content][:3],
-                        "result_content": execution_state.get("result_page_content", "")[:500] if execution_state.get("result_page_content") else None
-                    }
+            # Site-specific validation: one URL search picks the site's validator
+            site_match = self._SITE_VALIDATOR_RE.search(current_url)
+            if site_match:
+                site_result = self._site_validators[site_match.group(1)](page, full_content, execution_state, result_preview)
+                if site_result:
+                    return site_result
             
             # Check for failure patterns first
+            # (the first failure hit decides, so the pattern scan stops there)
             if validation_type == "login":
-                failure_count = 0
-                for pattern in self.validation_patterns["login_failure"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        failure_count += 1
-                
-                if failure_count >= 1:
+                if next(self._pattern_hits("login_failure", full_content), None) is not None:
                     return {
                         "action": "validate_page",
                         "status": "Failed",
@@ -1358,19 +1834,14 @@ class UniversalExecutor:
                     }
             
             elif validation_type == "signup":
-                failure_count = 0
-                for pattern in self.validation_patterns["signup_failure"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        failure_count += 1
-                
-                if failure_count >= 1:
-                    error_details = "❌ Signup failed: "
-                    if "email already exists" in full_content or "account already exists" in full_content:
-                        error_details += "Email already exists"
-                    elif "password too weak" in full_content or "password must be" in full_content:
-                        error_details += "Password too weak"
-                    else:
-                        error_details += "Invalid data provided"
+                if next(self._pattern_hits("signup_failure", full_content), None) is not None:
+                    # Diagnostic phrases are signup_failure literals, so the page scan already has them
+                    page_literals = self._literal_hits(full_content)
+                    reason = next(
+                        (message for phrase, message in _SIGNUP_ERROR_MESSAGES.items() if phrase in page_literals),
+                        "Invalid data provided"
+                    )
+                    error_details = f"❌ Signup failed: {reason}"
                     
                     return {
                         "action": "validate_page", 
@@ -1379,47 +1850,34 @@ class UniversalExecutor:
                     }
             
             # Check for success patterns
-            success_indicators = []
+            # Insertion-ordered dict as a set: hits stay unique and in the order found
+            success_indicators = {}
             
             if validation_type == "login":
-                for pattern in self.validation_patterns["login_success"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        match = re.search(pattern, full_content, re.IGNORECASE)
-                        success_indicators.append(match.group(0) if match else pattern)
+                success_indicators.update(dict.fromkeys(self._pattern_hits("login_success", full_content)))
                 
                 # Special check for Twitter/X
                 if text == "@":
-                    username_matches = re.findall(r'@[a-zA-Z0-9_]+', full_content)
-                    if username_matches:
-                        success_indicators.extend(username_matches[:2])
+                    # First two handles only: stop scanning once they are found
+                    success_indicators.update(dict.fromkeys(m.group(0) for m in islice(_TWITTER_HANDLE_RE.finditer(full_content), 2)))
             
             elif validation_type == "signup":
-                for pattern in self.validation_patterns["signup_success"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        match = re.search(pattern, full_content, re.IGNORECASE)
-                        success_indicators.append(match.group(0) if match else pattern)
+                success_indicators.update(dict.fromkeys(self._pattern_hits("signup_success", full_content)))
             
             elif validation_type == "shopping":
-                for pattern in self.validation_patterns["shopping_success"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        match = re.search(pattern, full_content, re.IGNORECASE)
-                        success_indicators.append(match.group(0) if match else pattern)
+                success_indicators.update(dict.fromkeys(self._pattern_hits("shopping_success", full_content)))
             
             elif validation_type == "search":
-                for pattern in self.validation_patterns["search_success"]:
-                    if re.search(pattern, full_content, re.IGNORECASE):
-                        match = re.search(pattern, full_content, re.IGNORECASE)
-                        success_indicators.append(match.group(0) if match else pattern)
+                success_indicators.update(dict.fromkeys(self._pattern_hits("search_success", full_content)))
             
             # Generic text check
             if text:
-                text_indicators = [t.strip() for t in text.split(',')]
-                for indicator in text_indicators:
-                    if indicator.lower() in full_content:
-                        success_indicators.append(indicator)
+                # Automaton for this text is built once and reused across steps
+                text_indicators, scan_indicators = _text_indicator_scanner(text)
+                text_hits = scan_indicators(full_content)
+                success_indicators.update(dict.fromkeys(indicator for indicator, lowered in text_indicators if lowered in text_hits))
             
-            # Remove duplicates
-            success_indicators = list(set(success_indicators))
+            success_indicators = list(success_indicators)
             
             # Evaluate results
             if len(success_indicators) >= min_indicators:
@@ -1429,7 +1887,7 @@ class UniversalExecutor:
                 if validation_type == "signup":
                     if execution_state.get("has_provided_credentials", False):
                         if "email" in self.used_provided_data:
-                            details += f" | Used provided email: {self.used_provided_data['email'][:10]}..."
+                            details += f" | Used provided email: {self._trunc(self.used_provided_data['email'], 10)}"
                     
                     if execution_state.get("has_generated_data", False):
                         details += f" | Used generated data for {len(self.generated_data)} fields"
@@ -1439,7 +1897,7 @@ class UniversalExecutor:
                     "status": "Passed",
                     "details": details,
                     "indicators_found": success_indicators,
-                    "result_content": execution_state.get("result_page_content", "")[:500] if execution_state.get("result_page_content") else None
+                    "result_content": result_preview
                 }
             else:
                 return {
@@ -1447,7 +1905,7 @@ class UniversalExecutor:
                     "status": "Failed",
                     "details": f"❌ Validation failed. Need {min_indicators} indicators, found {len(success_indicators)}",
                     "indicators_found": success_indicators,
-                    "result_content": execution_state.get("result_page_content", "")[:500] if execution_state.get("result_page_content") else None
+                    "result_content": result_preview
                 }
         
         except Exception as e:
@@ -1458,96 +1916,4 @@ class UniversalExecutor:
             }
 
 
-# Example usage and testing
-if __name__ == "__main__":
-    executor = UniversalExecutor()
-    
-    print(f"\n{'='*60}")
-    print("Testing Universal Executor with Enhanced Screenshot Capture...")
-    print('='*60)
-    
-    # Test case: Google search example (like "go to google search apples")
-    google_search_test = [
-        {
-            "action": "navigate", 
-            "url": "https://www.google.com",
-            "description": "Navigate to Google"
-        },
-        {
-            "action": "wait", 
-            "seconds": 2,
-            "description": "Wait for page to load"
-        },
-        {
-            "action": "type",
-            "selector": "textarea[name='q']",
-            "value": "apples nutrition facts",
-            "field_type": "search",
-            "description": "Search for apples nutrition"
-        },
-        {
-            "action": "click",
-            "selector": "input[value='Google Search']",
-            "text": "Google Search",
-            "description": "Click search button"
-        },
-        {
-            "action": "wait", 
-            "seconds": 3,
-            "description": "Wait for search results"
-        },
-        {
-            "action": "validate_page",
-            "type": "search",
-            "text": "results, showing, apples",
-            "min_indicators": 2,
-            "description": "Validate search results page"
-        }
-    ]
-    
-    print("\nTest Case: Google search for 'apples nutrition facts'")
-    print("-" * 50)
-    
-    # Generate a test report ID
-    test_report_id = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    
-    results = executor.run(
-        parsed_actions=google_search_test, 
-        headless=False, 
-        report_id=test_report_id,
-        instruction="Go to google search apples nutrition facts"
-    )
-    
-    # Print results
-    for r in results:
-        status_icon = "✅" if r['status'] == "Passed" else "❌" if r['status'] == "Failed" else "ℹ️"
-        step_num = r.get('step', '?')
-        action_desc = r.get('description', r['action'])
-        print(f"{status_icon} Step {step_num}: {action_desc}: {r['details']}")
-        
-        if r.get('screenshot'):
-            print(f"   📸 Screenshot: {r['screenshot']}")
-        
-        if r.get('result_content'):
-            print(f"   📋 Content: {r['result_content'][:100]}...")
-    
-    # Get screenshot metadata
-    screenshots_metadata = executor.get_screenshots_metadata()
-    if screenshots_metadata.get('count', 0) > 0:
-        print(f"\n📸 Screenshots captured:")
-        print(f"   Total: {screenshots_metadata['count']}")
-        
-        if screenshots_metadata.get('result_page'):
-            print(f"   Result Page: {screenshots_metadata['result_page'].get('filename', 'captured')}")
-            print(f"   Result Summary: {screenshots_metadata['result_page'].get('result_summary', 'Available')}")
-        
-        if screenshots_metadata.get('last_failed'):
-            print(f"   Last Failed Step: Step {screenshots_metadata['last_failed'].get('step_number', '?')}")
-    
-    result_summary = executor.get_result_summary()
-    if result_summary:
-        print(f"\n📋 Final Result Summary: {result_summary[:200]}...")
-    
-    print(f"\n{'='*60}")
-    print("Executor ready for integration with reporting system")
-    print('='*60)
\ No newline at end of file
+# Example usage and testing: python -m agent._universal_executor_demo (from Milestone4/)
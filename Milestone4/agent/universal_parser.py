@@ -4,11 +4,17 @@ Maintains all existing functionality but fixes parsing issues
 """
 
 import os
+import base64
+import copy
 import json
 import re
 import random
+import secrets
+import threading
 import time
-from typing import List, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
 
 # Import random data generator
 try:
@@ -22,109 +28,272 @@ except ImportError:
     def get_random_profile():
         return {}
 
+# Optional Aho-Corasick automaton for finding every site keyword in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional RE2 (linear-time DFA matching, no backtracking) for the extraction
+# regexes; plain re otherwise. Flags are written inline, as RE2 takes no re flags.
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+_extraction_re = re2 if RE2_AVAILABLE else re
+
+
+# Generated test data
+_EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "mail.com", "protonmail.com", "hotmail.com")
+_FIRST_NAMES = ("John", "Jane", "David", "Sarah", "Michael", "Emily", "Robert", "Lisa", "William", "Maria")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Garcia", "Rodriguez", "Wilson")
+_PASSWORD_SYMBOLS = "!@#$%^&*"
+
+
+def _random_token(length):
+    """Random lowercase [a-z2-7] string of the given length, encoded in C from os.urandom"""
+    return base64.b32encode(os.urandom((length * 5 + 7) // 8)).decode("ascii")[:length].lower()
+
+
+# Field extraction patterns, compiled once. Each field is searched for on its own
+# (first pattern that matches wins), so one phrase can fill several fields: the
+# "name" pattern also picks up "first name john", which sites that ask for a full
+# name rely on.
+_EMAIL_ADDRESS = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_FIELD_PATTERNS = tuple((field, _extraction_re.compile(pattern)) for field, pattern in (
+    ("email", r'(?i)email\s+(?:is\s+|as\s+)?(' + _EMAIL_ADDRESS + r')'),
+    ("email", r'(?i)(' + _EMAIL_ADDRESS + r')'),
+    ("password", r'password\s+(?:is\s+|as\s+)?(\S+)'),
+    ("password", r'pass\s+(?:is\s+|as\s+)?(\S+)'),
+    ("username", r'username\s+(?:is\s+|as\s+)?(\S+)'),
+    ("username", r'user\s+(?:is\s+|as\s+)?(\S+)'),
+    ("name", r'name\s+(?:is\s+|as\s+)?([a-zA-Z]+(?:\s+[a-zA-Z]+)?)'),
+    ("first_name", r'first[\s_-]?name\s+(?:is\s+|as\s+)?([a-zA-Z]+)'),
+    ("last_name", r'last[\s_-]?name\s+(?:is\s+|as\s+)?([a-zA-Z]+)'),
+))
+# Fields searched in the instruction as typed; every other field in its lowercase form
+_CASE_KEPT_FIELDS = frozenset({"email"})
+# Trailing punctuation stripped from free-form \S+ values
+_PUNCT_STRIPPED_FIELDS = frozenset({"password", "username"})
+
+# Search query patterns (lowercased instruction), most specific first
+_SEARCH_QUERY_PATTERNS = tuple(_extraction_re.compile(p) for p in (
+    r'search\s+(?:for\s+)?(.+?)\s+on\s+wikipedia',
+    r'find\s+(.+?)\s+on\s+wikipedia',
+    r'search\s+(?:for\s+)?(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
+    r'find\s+(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
+    r'look for\s+(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
+))
+
+# Action keywords, in priority order: the first action with any keyword present wins
+_ACTION_KEYWORDS = (
+    ("search", ("search", "find", "look for")),
+    ("login", ("login", "signin", "sign in", "log in")),
+    ("signup", ("signup", "register", "sign up", "join", "create account", "create")),
+    ("navigate", ("go to", "open", "visit", "navigate", "launch", "move to")),
+)
+# One pass finds the keywords at every position (a zero-width lookahead, so one
+# keyword never hides another that overlaps it); the group name is the action.
+# Stays on re: RE2 has no lookarounds.
+_ACTION_RE = re.compile("(?=" + "|".join(
+    f"(?P<{action}>{'|'.join(map(re.escape, keywords))})" for action, keywords in _ACTION_KEYWORDS
+) + ")")
+
+# A URL or bare domain in a navigation instruction; the scheme group is set
+# only when the URL already has one
+_URL_RE = _extraction_re.compile(r'(?P<scheme>https?://)\S+|www\.\S+|\S+\.(?:com|org|net|in)\S*')
+
+
+@dataclass(frozen=True, slots=True)
+class SiteConfig:
+    """URLs, form fields and selectors for a known website"""
+    url: str
+    login_url: Optional[str] = None
+    signup_url: Optional[str] = None
+    login_fields: tuple = ()
+    signup_fields: tuple = ()
+    search_selector: Optional[str] = None
+    signup_flow: Optional[str] = None
+    required_for_signup: tuple = ()
+
 
 class UniversalParser:
     """
     FIXED Parser: Simple instructions work correctly + maintains all features
     """
     
+    # Deterministic parses (no random data, no AI) shared across instances, most
+    # recently used last; the app creates a parser per request
+    PARSE_CACHE_SIZE = 256
+    _parse_cache = OrderedDict()
+    _parse_cache_lock = threading.Lock()
+    
+    # Per-parse trace output. Set PARSER_DEBUG=0 (or UniversalParser.DEBUG = False)
+    # to silence it; trace lines are then never formatted
+    DEBUG = os.getenv("PARSER_DEBUG", "1").lower() not in ("0", "false", "no")
+    
+    # Shopping flow selectors: first product on a results page, and Add to Cart
+    _PRODUCT_SELECTORS = {
+        "flipkart": "a[href*='/p/'], ._1fQZEK, div[data-tkid]",
+        "amazon": "a[href*='/dp/'], .s-result-item h2 a, .s-title-instructions-style h2 a"
+    }
+    _ADD_CART_SELECTORS = {
+        "amazon": "#add-to-cart-button, #addToCart, input[name='submit.add-to-cart']",
+        "flipkart": "button:has-text('ADD TO CART'), button._2KpZ6l, ._3v1-ww",
+        "default": "button:has-text('Add to Cart'), #add-to-cart-button"
+    }
+    
     def __init__(self, api_key=None, use_random_data=False):
-        self.use_ai = False
+        self._use_ai = False
+        self._ai_checked = False
         self.client = None
         self.model_name = "gemini-1.5-flash"
         self.use_random_data = use_random_data
         
+        # Gemini is set up on first use of use_ai, not here; there is no test
+        # request: a failed AI parse falls back to regex mode for later calls
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        self._init_ai()
         
         # Known websites with specific requirements
-        self.site_configs = {
-            "facebook": {
-                "url": "https://facebook.com",
-                "login_url": "https://facebook.com",
-                "login_fields": ["email", "password"],
-                "signup_fields": ["first_name", "last_name", "email", "password", "birth_day", "birth_month", "birth_year", "gender"],
-                "signup_flow": "facebook"
-            },
-            "twitter": {
-                "url": "https://twitter.com",
-                "login_url": "https://twitter.com/i/flow/login",
-                "signup_url": "https://twitter.com/i/flow/signup",
-                "login_fields": ["username", "password"],
-                "signup_fields": ["name", "email", "password", "birth_month", "birth_day", "birth_year"],
-                "signup_flow": "twitter_step_by_step"
-            },
-            "x.com": {
-                "url": "https://x.com",
-                "login_url": "https://x.com/i/flow/login",
-                "signup_url": "https://x.com/i/flow/signup",
-                "login_fields": ["username", "password"],
-                "signup_fields": ["name", "email", "password", "birth_month", "birth_day", "birth_year"],
-                "signup_flow": "twitter_step_by_step"
-            },
-            "instagram": {
-                "url": "https://instagram.com",
-                "login_url": "https://instagram.com/accounts/login/",
-                "signup_fields": ["email", "name", "username", "password"],
-                "signup_flow": "instagram"
-            },
-            "linkedin": {
-                "url": "https://linkedin.com",
-                "login_url": "https://linkedin.com/login",
-                "signup_url": "https://linkedin.com/signup",
-                "login_fields": ["email", "password"],
-                "signup_fields": ["first_name", "last_name", "email", "password"],
-                "signup_flow": "linkedin",
-                "required_for_signup": ["email", "password"]
-            },
-            "amazon": {
-                "url": "https://amazon.com",
-                "login_url": "https://amazon.com/ap/signin",
-                "search_selector": "#twotabsearchtextbox, input[name='field-keywords']",
-                "signup_fields": ["name", "email", "password"],
-                "signup_flow": "generic"
-            },
-            "flipkart": {
-                "url": "https://flipkart.com",
-                "search_selector": "input[name='q'], input[title='Search for products, brands and more']",
-                "signup_fields": ["email", "password"],
-                "signup_flow": "generic"
-            },
-            "google": {
-                "url": "https://google.com",
-                "login_url": "https://accounts.google.com",
-                "search_selector": "textarea[name='q'], input[name='q']",
-                "signup_fields": ["first_name", "last_name", "email", "password"],
-                "signup_flow": "generic"
-            },
-            "youtube": {
-                "url": "https://youtube.com",
-                "search_selector": "input[name='search_query'], input[id='search']",
-            },
-            "wikipedia": {
-                "url": "https://wikipedia.org",
-                "search_selector": "#searchInput, input[name='search']",
-                "signup_flow": "generic"
-            },
-            "wiki": {
-                "url": "https://wikipedia.org",
-                "search_selector": "#searchInput, input[name='search']",
-                "signup_flow": "generic"
-            },
-            "reddit": {
-                "url": "https://reddit.com",
-                "signup_fields": ["email", "username", "password"],
-                "signup_flow": "generic"
-            },
-            "github": {
-                "url": "https://github.com",
-                "signup_fields": ["email", "username", "password"],
-                "signup_flow": "generic"
-            }
+        self.site_configs: Dict[str, SiteConfig] = {
+            "facebook": SiteConfig(
+                url="https://facebook.com",
+                login_url="https://facebook.com",
+                login_fields=("email", "password"),
+                signup_fields=("first_name", "last_name", "email", "password", "birth_day", "birth_month", "birth_year", "gender"),
+                signup_flow="facebook"
+            ),
+            "twitter": SiteConfig(
+                url="https://twitter.com",
+                login_url="https://twitter.com/i/flow/login",
+                signup_url="https://twitter.com/i/flow/signup",
+                login_fields=("username", "password"),
+                signup_fields=("name", "email", "password", "birth_month", "birth_day", "birth_year"),
+                signup_flow="twitter_step_by_step"
+            ),
+            "x.com": SiteConfig(
+                url="https://x.com",
+                login_url="https://x.com/i/flow/login",
+                signup_url="https://x.com/i/flow/signup",
+                login_fields=("username", "password"),
+                signup_fields=("name", "email", "password", "birth_month", "birth_day", "birth_year"),
+                signup_flow="twitter_step_by_step"
+            ),
+            "instagram": SiteConfig(
+                url="https://instagram.com",
+                login_url="https://instagram.com/accounts/login/",
+                signup_fields=("email", "name", "username", "password"),
+                signup_flow="instagram"
+            ),
+            "linkedin": SiteConfig(
+                url="https://linkedin.com",
+                login_url="https://linkedin.com/login",
+                signup_url="https://linkedin.com/signup",
+                login_fields=("email", "password"),
+                signup_fields=("first_name", "last_name", "email", "password"),
+                signup_flow="linkedin",
+                required_for_signup=("email", "password")
+            ),
+            "amazon": SiteConfig(
+                url="https://amazon.com",
+                login_url="https://amazon.com/ap/signin",
+                search_selector="#twotabsearchtextbox, input[name='field-keywords']",
+                signup_fields=("name", "email", "password"),
+                signup_flow="generic"
+            ),
+            "flipkart": SiteConfig(
+                url="https://flipkart.com",
+                search_selector="input[name='q'], input[title='Search for products, brands and more']",
+                signup_fields=("email", "password"),
+                signup_flow="generic"
+            ),
+            "google": SiteConfig(
+                url="https://google.com",
+                login_url="https://accounts.google.com",
+                search_selector="textarea[name='q'], input[name='q']",
+                signup_fields=("first_name", "last_name", "email", "password"),
+                signup_flow="generic"
+            ),
+            "youtube": SiteConfig(
+                url="https://youtube.com",
+                search_selector="input[name='search_query'], input[id='search']",
+            ),
+            "wikipedia": SiteConfig(
+                url="https://wikipedia.org",
+                search_selector="#searchInput, input[name='search']",
+                signup_flow="generic"
+            ),
+            "wiki": SiteConfig(
+                url="https://wikipedia.org",
+                search_selector="#searchInput, input[name='search']",
+                signup_flow="generic"
+            ),
+            "reddit": SiteConfig(
+                url="https://reddit.com",
+                signup_fields=("email", "username", "password"),
+                signup_flow="generic"
+            ),
+            "github": SiteConfig(
+                url="https://github.com",
+                signup_fields=("email", "username", "password"),
+                signup_flow="generic"
+            )
         }
+        
+        # Site keywords in detection priority order: Wikipedia and LinkedIn
+        # aliases first, then the configured sites
+        self._site_keywords = (
+            ("wikipedia", "wikipedia"),
+            ("wiki", "wikipedia"),
+            ("linkedin", "linkedin"),
+            ("linked in", "linkedin"),
+            *((site, site) for site in self.site_configs),
+        )
+        self._site_automaton = self._build_site_automaton()
+        # Without the automaton: (priority, keyword, site) bucketed by the
+        # keyword's first letter, so only letters in the instruction are tried
+        self._site_keywords_by_first_char = {}
+        for priority, (keyword, site) in enumerate(self._site_keywords):
+            self._site_keywords_by_first_char.setdefault(keyword[0], []).append((priority, keyword, site))
+        
+        # Site names and action words stripped from search queries, as one
+        # alternation (longest first, so "add to cart" wins over "add")
+        remove_words = list(self.site_configs) + [
+            "add to cart", "add", "buy", "purchase", "and then",
+            "login", "signup", "then", "wikipedia", "wiki"
+        ]
+        self._search_stopword_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, sorted(set(remove_words), key=len, reverse=True))) + r')\b'
+        )
+    
+    def _build_site_automaton(self):
+        """All site keywords in one automaton; each keyword keeps its (priority, site)"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        automaton = ahocorasick.Automaton()
+        for priority, (keyword, site) in enumerate(self._site_keywords):
+            if keyword not in automaton:
+                automaton.add_word(keyword, (priority, site))
+        automaton.make_automaton()
+        return automaton
+    
+    def _debug(self, message: str, *args):
+        """Print a trace line; %-style args are only formatted when DEBUG is on"""
+        if self.DEBUG:
+            print(message % args if args else message)
+    
+    @property
+    def use_ai(self) -> bool:
+        """Whether AI parsing is available; initializes Gemini on first access"""
+        if not self._ai_checked:
+            self._init_ai()
+        return self._use_ai
     
     def _init_ai(self):
-        """Initialize Gemini AI"""
+        """Initialize Gemini AI (once)"""
+        self._ai_checked = True
         if not self.api_key:
             print("⚠️ No GEMINI_API_KEY. Using regex mode.")
             return
@@ -132,15 +301,8 @@ class UniversalParser:
         try:
             from google import genai
             self.client = genai.Client(api_key=self.api_key)
-            
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents="Say OK"
-            )
-            
-            if response.text and "OK" in response.text.upper():
-                self.use_ai = True
-                print("🤖 AI MODE ENABLED")
+            self._use_ai = True
+            print("🤖 AI MODE ENABLED")
         except:
             print("⚠️ Using regex mode.")
     
@@ -150,45 +312,42 @@ class UniversalParser:
         """
         # Check if user provided this field
         if field_name in extracted_fields and extracted_fields[field_name]:
-            print(f"✅ Using provided field: {field_name} = {extracted_fields[field_name][:20]}...")
+            self._debug("✅ Using provided field: %s = %.20s...", field_name, extracted_fields[field_name])
             return extracted_fields[field_name]
         
         # If field is missing and random data is enabled, generate it
         if self.use_random_data and RANDOM_DATA_AVAILABLE:
-            print(f"🎲 Generating random data for missing field: {field_name}")
+            self._debug("🎲 Generating random data for missing field: %s", field_name)
             
             # Special handling for email to ensure uniqueness
             if field_name == "email":
                 timestamp = int(time.time())
-                random_str = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=10))
-                domains = ["gmail.com", "yahoo.com", "outlook.com", "mail.com", "protonmail.com", "hotmail.com"]
+                random_str = _random_token(10)
+                domain = random.choice(_EMAIL_DOMAINS)
                 
                 # Site-specific email formatting
                 if site == "linkedin":
-                    return f"linkedin_test_{timestamp}_{random_str}@{random.choice(domains)}"
+                    return f"linkedin_test_{timestamp}_{random_str}@{domain}"
                 elif site == "twitter":
-                    return f"twitter_test_{timestamp}_{random_str}@{random.choice(domains)}"
+                    return f"twitter_test_{timestamp}_{random_str}@{domain}"
                 else:
-                    return f"test{timestamp}_{random_str}@{random.choice(domains)}"
+                    return f"test{timestamp}_{random_str}@{domain}"
             
-            # Special handling for password to ensure strength
+            # Special handling for password to ensure strength: 12 URL-safe
+            # characters plus one symbol
             elif field_name == "password":
-                chars = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*'
-                return ''.join(random.choices(chars, k=12))
+                return secrets.token_urlsafe(9) + secrets.choice(_PASSWORD_SYMBOLS)
             
             # For name fields
             elif field_name in ["first_name", "name"]:
-                first_names = ["John", "Jane", "David", "Sarah", "Michael", "Emily", "Robert", "Lisa", "William", "Maria"]
-                return random.choice(first_names)
+                return random.choice(_FIRST_NAMES)
             
             elif field_name == "last_name":
-                last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Garcia", "Rodriguez", "Wilson"]
-                return random.choice(last_names)
+                return random.choice(_LAST_NAMES)
             
             elif field_name == "username":
                 timestamp = int(time.time())
-                random_str = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=8))
-                return f"user_{timestamp}_{random_str}"
+                return f"user_{timestamp}_{_random_token(8)}"
             
             # For other fields, use random data generator if available
             return get_random_data(field_name)
@@ -204,8 +363,8 @@ class UniversalParser:
         if not instruction:
             return [{"action": "error", "error": "Empty instruction"}]
         
-        print(f"\n🔍 Parsing: '{instruction}'")
-        print(f"🎲 Random Data: {'ON' if self.use_random_data else 'OFF'}")
+        self._debug("\n🔍 Parsing: '%s'", instruction)
+        self._debug("🎲 Random Data: %s", "ON" if self.use_random_data else "OFF")
         
         # First, try AI if available
         if self.use_ai and self.client:
@@ -215,8 +374,47 @@ class UniversalParser:
                 print(f"⚠️ AI parsing failed: {e}")
                 print("🔄 Falling back to smart parser...")
         
+        # Random data makes every parse different, so only plain parses are cached
+        if self.use_random_data:
+            return self._parse_simple(instruction)
+        
+        cache = self._parse_cache
+        with self._parse_cache_lock:
+            cached = cache.get(instruction)
+            if cached is not None:
+                cache.move_to_end(instruction)
+        if cached is not None:
+            self._debug("♻️ Using cached parse")
+            # Callers mutate the actions, so each one gets its own copy
+            return copy.deepcopy(cached)
+        
         # Use the new simplified parser that works for all cases
-        return self._parse_simple(instruction)
+        actions = self._parse_simple(instruction)
+        with self._parse_cache_lock:
+            cache[instruction] = copy.deepcopy(actions)
+            if len(cache) > self.PARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return actions
+    
+    def parse_many(self, instructions: List[str]) -> List[List[Dict[str, Any]]]:
+        """Parse a batch of instructions; repeated instructions are parsed (and sent
+        to the AI) once, unless random data is on and each needs its own values"""
+        if self.use_random_data:
+            return [self.parse(instruction) for instruction in instructions]
+        
+        results = {}
+        for instruction in dict.fromkeys(instruction.strip() for instruction in instructions):
+            results[instruction] = self.parse(instruction)
+        
+        # Every caller-owned action list is a separate copy, duplicates included
+        batch = []
+        seen = set()
+        for instruction in instructions:
+            key = instruction.strip()
+            actions = results[key]
+            batch.append(copy.deepcopy(actions) if key in seen else actions)
+            seen.add(key)
+        return batch
     
     def _parse_simple(self, instruction: str) -> List[Dict[str, Any]]:
         """
@@ -226,106 +424,38 @@ class UniversalParser:
         instruction_lower = instruction.lower()
         actions = []
         
-        print(f"🔄 Using simple parser for: '{instruction}'")
+        self._debug("🔄 Using simple parser for: '%s'", instruction)
         
         # ==================== STEP 1: EXTRACT ALL FIELDS ====================
         extracted_fields = {}
         
-        # Extract email
-        email_patterns = [
-            r'email\s+(?:is\s+|as\s+)?([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'with\s+email\s+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        ]
-        
-        for pattern in email_patterns:
-            match = re.search(pattern, instruction, re.IGNORECASE)
-            if match:
-                email = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                if "@" in email:
-                    extracted_fields["email"] = email
-                    print(f"📧 Extracted email: {email}")
-                    break
-        
-        # Extract password
-        pass_patterns = [
-            r'password\s+(?:is\s+|as\s+)?(\S+)',
-            r'pass\s+(?:is\s+|as\s+)?(\S+)',
-            r'with\s+password\s+(\S+)'
-        ]
-        
-        for pattern in pass_patterns:
-            match = re.search(pattern, instruction_lower)
-            if match:
-                password = match.group(1).rstrip('.,;:!?')
-                extracted_fields["password"] = password
-                print(f"🔑 Extracted password: {password[:6]}******")
-                break
-        
-        # Extract username
-        user_patterns = [
-            r'username\s+(?:is\s+|as\s+)?(\S+)',
-            r'user\s+(?:is\s+|as\s+)?(\S+)',
-            r'with\s+username\s+(\S+)'
-        ]
-        
-        for pattern in user_patterns:
-            match = re.search(pattern, instruction_lower)
-            if match:
-                username = match.group(1).rstrip('.,;:!?')
-                extracted_fields["username"] = username
-                print(f"👤 Extracted username: {username}")
-                break
-        
-        # Extract name
-        name_patterns = [
-            r'name\s+(?:is\s+|as\s+)?([a-zA-Z]+(?:\s+[a-zA-Z]+)?)',
-            r'with\s+name\s+([a-zA-Z]+(?:\s+[a-zA-Z]+)?)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, instruction_lower)
-            if match:
-                name = match.group(1)
-                extracted_fields["name"] = name
-                print(f"📛 Extracted name: {name}")
-                break
-        
-        # Extract first name
-        first_patterns = [
-            r'first[\s_-]?name\s+(?:is\s+|as\s+)?([a-zA-Z]+)',
-            r'first\s+name\s+([a-zA-Z]+)'
-        ]
-        
-        for pattern in first_patterns:
-            match = re.search(pattern, instruction_lower)
+        for field, pattern in _FIELD_PATTERNS:
+            if field in extracted_fields:
+                continue
+            match = pattern.search(instruction if field in _CASE_KEPT_FIELDS else instruction_lower)
             if match:
-                first_name = match.group(1)
-                extracted_fields["first_name"] = first_name
-                print(f"📛 Extracted first_name: {first_name}")
-                break
-        
-        # Extract last name
-        last_patterns = [
-            r'last[\s_-]?name\s+(?:is\s+|as\s+)?([a-zA-Z]+)',
-            r'last\s+name\s+([a-zA-Z]+)'
-        ]
-        
-        for pattern in last_patterns:
-            match = re.search(pattern, instruction_lower)
-            if match:
-                last_name = match.group(1)
-                extracted_fields["last_name"] = last_name
-                print(f"📛 Extracted last_name: {last_name}")
-                break
+                value = match.group(1)
+                if field in _PUNCT_STRIPPED_FIELDS:
+                    value = value.rstrip('.,;:!?')
+                extracted_fields[field] = value
+        
+        if "email" in extracted_fields:
+            self._debug("📧 Extracted email: %s", extracted_fields["email"])
+        if "password" in extracted_fields:
+            self._debug("🔑 Extracted password: %.6s******", extracted_fields["password"])
+        if "username" in extracted_fields:
+            self._debug("👤 Extracted username: %s", extracted_fields["username"])
+        for field in ("name", "first_name", "last_name"):
+            if field in extracted_fields:
+                self._debug("📛 Extracted %s: %s", field, extracted_fields[field])
         
         # ==================== STEP 2: DETECT SITE ====================
         site = self._detect_site(instruction_lower)
-        print(f"🌐 Detected site: {site}")
+        self._debug("🌐 Detected site: %s", site)
         
         # ==================== STEP 3: DETECT ACTION TYPE ====================
         action_type = self._detect_action_type(instruction_lower)
-        print(f"🎯 Detected action: {action_type}")
+        self._debug("🎯 Detected action: %s", action_type)
         
         # ==================== STEP 4: HANDLE EACH ACTION TYPE ====================
         if action_type == "search":
@@ -354,43 +484,37 @@ class UniversalParser:
     
     def _detect_site(self, instruction_lower: str) -> str:
         """Detect which website is mentioned"""
-        # Check for Wikipedia explicitly
-        if "wikipedia" in instruction_lower or "wiki" in instruction_lower:
-            return "wikipedia"
-        
-        # Check for LinkedIn variations
-        if "linkedin" in instruction_lower or "linked in" in instruction_lower:
-            return "linkedin"
-        
-        # Check other sites
-        for site in self.site_configs.keys():
-            if site in instruction_lower:
-                return site
-        
-        # Check for domains
-        words = instruction_lower.split()
-        for word in words:
-            clean_word = word.strip(".,;:!?()")
-            if "." in clean_word and not clean_word.startswith("."):
-                domain = clean_word.replace("www.", "").split(".")[0]
-                if domain in self.site_configs:
-                    return domain
-                return domain
+        # Known site keywords (Wikipedia, LinkedIn, then configured sites): the
+        # highest-priority keyword present wins, wherever it appears
+        if self._site_automaton is not None:
+            hits = [value for _, value in self._site_automaton.iter(instruction_lower)]
+            if hits:
+                return min(hits)[1]
+        else:
+            buckets = self._site_keywords_by_first_char
+            hits = [
+                entry
+                for char in buckets.keys() & set(instruction_lower)
+                for entry in buckets[char]
+                if entry[1] in instruction_lower
+            ]
+            if hits:
+                return min(hits)[2]
+        
+        # Check for domains: the first word with a dot inside its punctuation
+        # (strip() also removes leading dots); no dot at all skips the scan
+        if "." in instruction_lower:
+            for word in instruction_lower.split():
+                clean_word = word.strip(".,;:!?()")
+                if "." in clean_word:
+                    return clean_word.replace("www.", "").split(".")[0]
         
         return "unknown"
     
     def _detect_action_type(self, instruction_lower: str) -> str:
         """Detect what action is being requested"""
-        if any(kw in instruction_lower for kw in ["search", "find", "look for"]):
-            return "search"
-        elif any(kw in instruction_lower for kw in ["login", "signin", "sign in", "log in"]):
-            return "login"
-        elif any(kw in instruction_lower for kw in ["signup", "register", "sign up", "join", "create account", "create"]):
-            return "signup"
-        elif any(kw in instruction_lower for kw in ["go to", "open", "visit", "navigate", "launch", "move to"]):
-            return "navigate"
-        else:
-            return "unknown"
+        found = {match.lastgroup for match in _ACTION_RE.finditer(instruction_lower)}
+        return next((action for action, _ in _ACTION_KEYWORDS if action in found), "unknown")
     
     def _handle_search(self, instruction: str, instruction_lower: str, site: str, fields: Dict) -> List[Dict[str, Any]]:
         """Handle search actions"""
@@ -402,7 +526,7 @@ class UniversalParser:
         actions.append({"action": "wait", "seconds": 3})
         
         # Extract search query
-        query = self._extract_search_query(instruction)
+        query = self._extract_search_query(instruction_lower)
         
         if query:
             search_selector = self._get_search_selector(site)
@@ -415,15 +539,11 @@ class UniversalParser:
             actions.append({"action": "wait", "seconds": 3})
             
             # Handle add to cart
-            if "add to cart" in instruction_lower or "add" in instruction_lower:
+            if "add" in instruction_lower:  # also covers "add to cart"
                 actions.append({"action": "wait", "seconds": 5})
                 
-                if site in ["flipkart", "amazon"]:
-                    product_selector = {
-                        "flipkart": "a[href*='/p/'], ._1fQZEK, div[data-tkid]",
-                        "amazon": "a[href*='/dp/'], .s-result-item h2 a, .s-title-instructions-style h2 a"
-                    }.get(site, "a")
-                    
+                product_selector = self._PRODUCT_SELECTORS.get(site)
+                if product_selector:
                     actions.append({
                         "action": "click",
                         "selector": product_selector,
@@ -432,13 +552,7 @@ class UniversalParser:
                     })
                     actions.append({"action": "wait", "seconds": 5})
                 
-                add_cart_selectors = {
-                    "amazon": "#add-to-cart-button, #addToCart, input[name='submit.add-to-cart']",
-                    "flipkart": "button:has-text('ADD TO CART'), button._2KpZ6l, ._3v1-ww",
-                    "default": "button:has-text('Add to Cart'), #add-to-cart-button"
-                }
-                
-                selector = add_cart_selectors.get(site, add_cart_selectors["default"])
+                selector = self._ADD_CART_SELECTORS.get(site, self._ADD_CART_SELECTORS["default"])
                 actions.append({
                     "action": "click",
                     "selector": selector,
@@ -463,7 +577,8 @@ class UniversalParser:
         
         # Get login URL
         if site in self.site_configs:
-            login_url = self.site_configs[site].get("login_url", self.site_configs[site]["url"])
+            config = self.site_configs[site]
+            login_url = config.login_url or config.url
             actions.append({"action": "navigate", "url": login_url})
         else:
             url = self._get_site_url(site)
@@ -509,12 +624,13 @@ class UniversalParser:
         """Handle signup actions"""
         actions = []
         
-        print(f"🎯 SIGNUP DETECTED for {site}")
-        print(f"📋 Available fields: {list(fields.keys())}")
+        self._debug("🎯 SIGNUP DETECTED for %s", site)
+        self._debug("📋 Available fields: %s", list(fields))
         
         # Get required fields for this site
-        required_fields = self.site_configs.get(site, {}).get("signup_fields", ["email", "password"])
-        print(f"🔧 Required fields for {site}: {required_fields}")
+        config = self.site_configs.get(site)
+        required_fields = list(config and config.signup_fields or ("email", "password"))
+        self._debug("🔧 Required fields for %s: %s", site, required_fields)
         
         # Get or generate values
         generated_fields = {}
@@ -527,7 +643,7 @@ class UniversalParser:
         has_email = "email" in generated_fields and generated_fields["email"]
         has_password = "password" in generated_fields and generated_fields["password"]
         
-        print(f"📊 Field check - Email: {has_email}, Password: {has_password}")
+        self._debug("📊 Field check - Email: %s, Password: %s", has_email, has_password)
         
         # For LinkedIn, we need first_name and last_name too
         if site == "linkedin":
@@ -562,7 +678,7 @@ class UniversalParser:
         
         # Get signup URL
         if site in self.site_configs:
-            signup_url = self.site_configs[site].get("signup_url", self.site_configs[site]["url"])
+            signup_url = config.signup_url or config.url
             actions.append({"action": "navigate", "url": signup_url})
         else:
             url = self._get_site_url(site)
@@ -592,10 +708,10 @@ class UniversalParser:
             ]
         else:
             # Try to extract URL from instruction
-            url_match = re.search(r'(https?://[^\s]+|www\.[^\s]+|\S+\.(com|org|net|in)[^\s]*)', instruction)
+            url_match = _URL_RE.search(instruction)
             if url_match:
                 url = url_match.group(0)
-                if not url.startswith("http"):
+                if not url_match.group("scheme"):
                     url = f"https://{url}"
                 return [
                     {"action": "navigate", "url": url},
@@ -608,27 +724,13 @@ class UniversalParser:
                     "suggestion": "Try: 'go to google.com' or 'open wikipedia.org'"
                 }]
     
-    def _extract_search_query(self, instruction: str) -> str:
-        """Extract search query from instruction"""
-        patterns = [
-            r'search\s+(?:for\s+)?(.+?)\s+on\s+wikipedia',
-            r'find\s+(.+?)\s+on\s+wikipedia',
-            r'search\s+(?:for\s+)?(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
-            r'find\s+(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
-            r'look for\s+(.+?)(?:\s+on|\s+in|\s+and|\s+then|$)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, instruction.lower())
+    def _extract_search_query(self, instruction_lower: str) -> str:
+        """Extract search query from the already-lowercased instruction"""
+        for pattern in _SEARCH_QUERY_PATTERNS:
+            match = pattern.search(instruction_lower)
             if match:
-                query = match.group(1).strip()
                 # Remove site names and action words
-                remove_words = list(self.site_configs.keys()) + [
-                    "add to cart", "add", "buy", "purchase", "and then", 
-                    "login", "signup", "then", "wikipedia", "wiki"
-                ]
-                for word in remove_words:
-                    query = query.replace(word, " ")
+                query = self._search_stopword_re.sub(" ", match.group(1))
                 return " ".join(query.split()).strip()
         
         return ""
@@ -636,15 +738,15 @@ class UniversalParser:
     def _get_search_selector(self, site: str) -> str:
         """Get search selector for site"""
         if site in self.site_configs:
-            return self.site_configs[site].get("search_selector", 
-                "input[type='search'], input[name='search'], input[type='text'], textarea[name='q'], input[name='q']")
+            return self.site_configs[site].search_selector or \
+                "input[type='search'], input[name='search'], input[type='text'], textarea[name='q'], input[name='q']"
         
         return "input[type='search'], input[name='search'], #search, .search-input, input[placeholder*='search' i], input[type='text']"
     
     def _get_site_url(self, site: str) -> str:
         """Get URL for site"""
         if site in self.site_configs:
-            return self.site_configs[site]["url"]
+            return self.site_configs[site].url
         elif "." in site:
             return f"https://{site}" if not site.startswith("http") else site
         else:
@@ -851,7 +953,7 @@ class UniversalParser:
         email = fields.get("email", "")
         password = fields.get("password", "")
         
-        print(f"🔧 LinkedIn Signup - First: {first_name}, Last: {last_name}, Email: {email}, Password: {'*' * 8}")
+        self._debug("🔧 LinkedIn Signup - First: %s, Last: %s, Email: %s, Password: ********", first_name, last_name, email)
         
         actions.append({
             "action": "type",
@@ -1219,6 +1321,7 @@ Return ONLY JSON array of actions."""
         
         except Exception as e:
             print(f"⚠️ AI parse failed: {e}")
+            self._use_ai = False
             return self._parse_simple(instruction)
 
 
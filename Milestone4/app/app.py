@@ -445,7 +445,7 @@ def api_download_screenshot(filename):
                 filepath,
                 as_attachment=True,
                 download_name=filename,
-                mimetype='image/png'
+                mimetype='image/jpeg' if filename.endswith('.jpg') else 'image/png'
             )
         else:
             print(f"[SCREENSHOT] File not found: {filename}")
@@ -467,7 +467,7 @@ def api_download_all_screenshots(report_id):
         # Find all screenshots for this report
         screenshot_files = []
         for filename in os.listdir(screenshot_dir):
-            if report_id in filename and filename.endswith('.png') and not filename.startswith('thumb_'):
+            if report_id in filename and filename.endswith(('.png', '.jpg')) and not filename.startswith('thumb_'):
                 screenshot_files.append(filename)
         
         if not screenshot_files:
@@ -517,14 +517,14 @@ def api_get_report_screenshots(report_id):
         # Find screenshots
         screenshots = []
         for filename in os.listdir(screenshot_dir):
-            if report_id in filename and filename.endswith('.png'):
+            if report_id in filename and filename.endswith(('.png', '.jpg')):
                 if filename.startswith('thumb_'):
                     continue
                 
                 filepath = os.path.join(screenshot_dir, filename)
                 
                 # Get thumbnail if exists
-                thumb_filename = f"thumb_{filename}"
+                thumb_filename = f"thumb_{os.path.splitext(filename)[0]}.jpg"
                 thumb_path = os.path.join(screenshot_dir, thumb_filename)
                 
                 screenshot_info = {
@@ -771,7 +771,10 @@ def api_run_test():
         executor = UniversalExecutor(api_key=GEMINI_API_KEY)
         
         # Execute the parsed actions
-        execution = executor.run(parsed, headless=headless, report_id=None, instruction=instruction)
+        try:
+            execution = executor.run(parsed, headless=headless, report_id=None, instruction=instruction)
+        finally:
+            executor.close()
         execution_time = time.time() - execution_start_time
         
         # Extract screenshots from execution steps
@@ -851,7 +854,7 @@ def api_run_test():
                         page_content = executor.page.inner_text("body")
                         # Clean content
                         import re
-                        page_content = re.sub(r'\s+', ' ', page_content)
+                        page_content = ' '.join(page_content.split())
                         if len(page_content) > 500:
                             page_content = page_content[:500] + "..."
                         
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+os.environ["GEMINI_API_KEY"] = ""
+
+from agent.universal_parser import UniversalParser
+
+
+def typed_values(actions):
+    """field_type -> value of the type actions"""
+    return {a["field_type"]: a["value"] for a in actions if a.get("action") == "type"}
+
+
+class FieldExtractionTest(unittest.TestCase):
+    """Field values must match what the original per-field regex parser extracted"""
+
+    def test_password_after_name(self):
+        actions = UniversalParser(use_random_data=True).parse(
+            "signup on amazon with name John password secret123 email j@x.com")
+        values = typed_values(actions)
+        self.assertEqual(values["password"], "secret123")
+        self.assertEqual(values["email"], "j@x.com")
+        self.assertTrue(values["name"].startswith("john"))
+
+    def test_fields_in_any_order(self):
+        actions = UniversalParser(use_random_data=True).parse(
+            "signup on twitter with email j@x.com name John password secret123")
+        values = typed_values(actions)
+        self.assertEqual(values["password"], "secret123")
+        self.assertEqual(values["email"], "j@x.com")
+        self.assertTrue(values["name"].startswith("john"))
+
+    def test_first_name_fills_name(self):
+        actions = UniversalParser().parse("signup on twitter with first name john")
+        self.assertEqual(actions[0]["action"], "error")
+        self.assertNotIn("name", actions[0]["missing_fields"])
+
+        actions = UniversalParser(use_random_data=True).parse("signup on twitter with first name john")
+        self.assertEqual(typed_values(actions)["name"], "john")
+
+    def test_login_fields(self):
+        actions = UniversalParser().parse("login to github with username Bob. password Pw!")
+        self.assertEqual(typed_values(actions), {"username": "bob", "password": "pw"})
+
+
+if __name__ == "__main__":
+    unittest.main()